@@ -1,8 +1,59 @@
 """Database utilities for social-tui."""
 
-import secrets
-import re
-from typing import Optional
+import os
+import threading
+from typing import Iterator, List, Optional
+
+# AWS-style IDs have a fixed shape (1-3 lowercase letters, a dash, 8 lowercase
+# hex characters), so they are checked with plain string ops instead of a regex.
+_PREFIX_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz')
+_HEX_CHARS = frozenset('0123456789abcdef')
+
+
+def _split_id(id_str: str) -> Optional[str]:
+    """Return the prefix of a well-formed AWS-style ID, or None."""
+    prefix, sep, hex_part = id_str.partition('-')
+    if not sep or len(hex_part) != 8 or not 1 <= len(prefix) <= 3:
+        return None
+    if not _PREFIX_CHARS.issuperset(prefix) or not _HEX_CHARS.issuperset(hex_part):
+        return None
+    return prefix
+
+
+class _RandomPool:
+    """Hands out random bytes from a buffer refilled by one os.urandom call.
+
+    Bulk imports mint two IDs per post, so reading 4 bytes at a time from the
+    OS would cost a syscall per ID.
+    """
+
+    def __init__(self, size: int = 4096):
+        self._size = size
+        self._reset()
+
+    def _reset(self):
+        """Drop any buffered bytes (also run in forked children, see below)."""
+        self._buffer = b''
+        self._offset = 0
+        self._lock = threading.Lock()
+
+    def take(self, n: int) -> bytes:
+        with self._lock:
+            if self._offset + n > len(self._buffer):
+                self._buffer = os.urandom(max(self._size, n))
+                self._offset = 0
+            chunk = self._buffer[self._offset:self._offset + n]
+            self._offset += n
+            return chunk
+
+
+_random_pool = _RandomPool()
+
+# A forked child inherits the buffer; without a reset it would hand out the
+# same bytes as the parent and mint duplicate IDs. The lock is replaced too,
+# as another parent thread may have held it at fork time.
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_random_pool._reset)
 
 
 def generate_aws_id(prefix: str) -> str:
@@ -16,13 +67,62 @@ def generate_aws_id(prefix: str) -> str:
 
     Examples:
         >>> id = generate_aws_id('p')
-        >>> assert re.match(r'p-[0-9a-f]{8}', id)
+        >>> assert validate_aws_id(id, expected_prefix='p')
     """
     # Generate 8 random hex characters (4 bytes = 8 hex chars)
-    random_hex = secrets.token_hex(4)
+    random_hex = _random_pool.take(4).hex()
     return f"{prefix}-{random_hex}"
 
 
+def generate_aws_ids(prefix: str, n: int) -> List[str]:
+    """Generate n random AWS-style identifiers with the given prefix.
+
+    Same IDs as n calls to generate_aws_id, but the random bytes for all of
+    them are drawn from the pool at once and hex-encoded in one pass.
+
+    Args:
+        prefix: The prefix to use (e.g., 'pft')
+        n: Number of IDs to generate
+
+    Returns:
+        List of n strings in the format '{prefix}-{xxxxxxxx}'
+
+    Examples:
+        >>> ids = generate_aws_ids('pft', 3)
+        >>> len(ids), all(validate_aws_id(i, expected_prefix='pft') for i in ids)
+        (3, True)
+    """
+    random_hex = _random_pool.take(4 * n).hex()
+    head = prefix + '-'
+    return [head + random_hex[i:i + 8] for i in range(0, 8 * n, 8)]
+
+
+def iter_aws_ids(prefix: str) -> Iterator[str]:
+    """Yield AWS-style identifiers from a random base and a counter.
+
+    For minting many IDs in one run (e.g. a data_download per imported post):
+    the 32-bit suffix starts at a random value and increments, so no
+    randomness is drawn after the first ID and the IDs of one run can never
+    collide with each other.
+
+    Args:
+        prefix: The prefix to use (e.g., 'dl')
+
+    Yields:
+        Strings in the format '{prefix}-{xxxxxxxx}'
+
+    Examples:
+        >>> ids = iter_aws_ids('dl')
+        >>> first, second = next(ids), next(ids)
+        >>> (int(second[3:], 16) - int(first[3:], 16)) % 2**32
+        1
+    """
+    value = int.from_bytes(_random_pool.take(4))
+    while True:
+        yield f"{prefix}-{value:08x}"
+        value = (value + 1) & 0xFFFFFFFF
+
+
 def validate_aws_id(id_str: str, expected_prefix: Optional[str] = None) -> bool:
     """Validate an AWS-style identifier.
 
@@ -46,17 +146,47 @@ def validate_aws_id(id_str: str, expected_prefix: Optional[str] = None) -> bool:
     if not isinstance(id_str, str):
         return False
 
+    if expected_prefix:
+        # Known prefixes have a prebuilt checker (see _VALIDATORS below)
+        validator = _VALIDATORS.get(expected_prefix)
+        if validator is not None:
+            return validator(id_str)
+        # Only well-formed prefixes can match; the rest is a fixed-shape check
+        if not 1 <= len(expected_prefix) <= 3 or not _PREFIX_CHARS.issuperset(expected_prefix):
+            return False
+        return has_prefix(id_str, expected_prefix)
+
     # Match pattern: prefix-xxxxxxxx where x is hex
-    pattern = r'^([a-z]{1,3})-([0-9a-f]{8})$'
-    match = re.match(pattern, id_str)
+    return _split_id(id_str) is not None
 
-    if not match:
-        return False
 
-    if expected_prefix and match.group(1) != expected_prefix:
-        return False
+def has_prefix(id_str: str, prefix: str) -> bool:
+    """Check that an ID is '{prefix}-' followed by 8 lowercase hex characters.
+
+    Faster than validate_aws_id when the caller already knows which prefix
+    to expect (e.g. PREFIX_POST), since the ID does not need to be split.
+    The prefix itself is not validated.
 
-    return True
+    Args:
+        id_str: The ID string to check
+        prefix: The expected prefix
+
+    Returns:
+        True if the ID has the given prefix and a valid hex suffix
+
+    Examples:
+        >>> has_prefix('p-a1b2c3d4', 'p')
+        True
+        >>> has_prefix('prf-a1b2c3d4', 'p')
+        False
+    """
+    n = len(prefix)
+    return (
+        len(id_str) == n + 9
+        and id_str.startswith(prefix)
+        and id_str[n] == '-'
+        and _HEX_CHARS.issuperset(id_str[n + 1:])
+    )
 
 
 def extract_prefix(id_str: str) -> Optional[str]:
@@ -76,9 +206,7 @@ def extract_prefix(id_str: str) -> Optional[str]:
         >>> extract_prefix('invalid')
         None
     """
-    pattern = r'^([a-z]{1,3})-[0-9a-f]{8}$'
-    match = re.match(pattern, id_str)
-    return match.group(1) if match else None
+    return _split_id(id_str)
 
 
 # Prefix constants for easy reference
@@ -91,3 +219,32 @@ PREFIX_PROFILE_TAG = 'pft'
 PREFIX_POST_TAG = 'ptg'
 PREFIX_ACTION = 'act'
 PREFIX_MEDIA = 'med'
+
+
+def _make_validator(prefix: str):
+    """Build a checker specialized for one known prefix.
+
+    The expected head ('{prefix}-') and total length are bound once, so a
+    check is a length compare, a startswith, and a hex-set test.
+    """
+    head = prefix + '-'
+    length = len(head) + 8
+    start = len(head)
+
+    def validator(id_str: str) -> bool:
+        return (
+            len(id_str) == length
+            and id_str.startswith(head)
+            and _HEX_CHARS.issuperset(id_str[start:])
+        )
+
+    return validator
+
+
+_VALIDATORS = {
+    prefix: _make_validator(prefix)
+    for prefix in (
+        PREFIX_POST, PREFIX_DOWNLOAD, PREFIX_RUN, PREFIX_PROFILE, PREFIX_TAG,
+        PREFIX_PROFILE_TAG, PREFIX_POST_TAG, PREFIX_ACTION, PREFIX_MEDIA,
+    )
+}
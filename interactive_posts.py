@@ -5,7 +5,7 @@ Now supports Supabase database backend for deduplication and management.
 """
 
 import json
-import glob
+import os
 import argparse
 import base64
 import sys
@@ -14,6 +14,7 @@ import websockets
 import hashlib
 import subprocess
 import logging
+from collections import Counter, OrderedDict
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
 from supabase_client import get_supabase_client
@@ -24,6 +25,12 @@ from textual.binding import Binding
 from textual.screen import Screen
 from textual import events
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Cache directory for downloaded images
 CACHE_DIR = Path("cache/images")
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
@@ -44,6 +51,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def loads_json(raw):
+    """Parse JSON text or bytes, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def get_cached_image_path(image_url: str) -> Path:
     """
     Get the cached image path for a given URL.
@@ -217,6 +231,73 @@ def display_image_kitty_to_terminal(image_url: str):
         print("You can open this URL in a browser to view the image.")
 
 
+def get_text_preview(post: dict) -> str:
+    """Return the post text truncated to 100 characters for TODO listings.
+
+    Only the marked posts need a preview, once per TODO screen or quit
+    summary, so it is computed on demand rather than stored on the post
+    (which would leak into saved exports and the raw JSON view).
+    """
+    text = post.get("text") or ""
+    return text[:100] + "..." if len(text) > 100 else text
+
+
+def get_searchable_text(post: dict) -> str:
+    """Return the lowercased text the content filter matches against.
+
+    Joins the post text (or its preview), title and author fields.
+    MainScreen computes it once per post when the posts load and keeps the
+    results in its filter columns, so filtering on each keystroke does no
+    string building or case folding per post. Nothing is stored on the post,
+    so saved and displayed posts stay exactly as loaded.
+    """
+    author = post.get("author")
+    author_name = author.get("name", "") if isinstance(author, dict) else ""
+    parts = (
+        post.get("text") or post.get("text_preview") or "",
+        post.get("title") or "",
+        author_name or "",
+        post.get("author_username") or "",
+    )
+    return " ".join(part for part in parts if part).lower()
+
+
+def build_trigram_index(searchables: list) -> dict:
+    """Map every 3-character substring to the indices of the texts containing it.
+
+    Any query of 3+ characters can only occur in texts that contain all of
+    its trigrams, so the index narrows a substring search to a few
+    candidates without changing which posts match.
+    """
+    index = {}
+    for idx, text in enumerate(searchables):
+        for gram in {text[i:i + 3] for i in range(len(text) - 2)}:
+            postings = index.get(gram)
+            if postings is None:
+                index[gram] = {idx}
+            else:
+                postings.add(idx)
+    return index
+
+
+def trigram_candidates(index: dict, query: str):
+    """Return the indices that may contain query, or None if it is too short to narrow."""
+    if len(query) < 3:
+        return None
+    postings = [index.get(query[i:i + 3]) for i in range(len(query) - 2)]
+    if not all(postings):
+        # Some trigram occurs in no post, so nothing can match
+        return set()
+    # Intersect from the most selective trigram down, stopping once empty
+    postings.sort(key=len)
+    candidates = set(postings[0])
+    for other in postings[1:]:
+        candidates &= other
+        if not candidates:
+            break
+    return candidates
+
+
 class RawJsonScreen(Screen):
     """Screen to show raw JSON data."""
 
@@ -671,7 +752,6 @@ class TodoScreen(Screen):
         for idx, post in enumerate(self.marked_posts_data, 1):
             author = post.get("author", {})
             posted_at = post.get("posted_at", {})
-            text = post.get("text", "")
             url = post.get("url", "N/A")
 
             # Construct name from first_name and last_name if 'name' field doesn't exist
@@ -681,8 +761,7 @@ class TodoScreen(Screen):
                 last_name = author.get('last_name', '')
                 name = f"{first_name} {last_name}".strip() or 'N/A'
 
-            # Truncate text for preview
-            text_preview = text[:100] + "..." if len(text) > 100 else text
+            text_preview = get_text_preview(post)
 
             lines.extend([
                 f"[bold yellow]({idx})[/bold yellow] Respond to post by [bold]{author.get('username', 'N/A')}[/bold]",
@@ -1193,16 +1272,14 @@ class RunStatisticsScreen(Screen):
                                   datetime.fromisoformat(r['started_at'].replace('Z', '+00:00')) > week_ago)
 
             # Calculate platform breakdown
-            platform_counts = {}
-            platform_posts = {}
+            platform_counts = Counter(r.get('platform', 'unknown') for r in all_runs)
+            platform_posts = Counter()
             for r in all_runs:
-                platform = r.get('platform', 'unknown')
-                platform_counts[platform] = platform_counts.get(platform, 0) + 1
-                platform_posts[platform] = platform_posts.get(platform, 0) + (r.get('posts_fetched', 0) or 0)
+                platform_posts[r.get('platform', 'unknown')] += r.get('posts_fetched', 0) or 0
 
-            platforms = [{'platform': p, 'run_count': platform_counts[p], 'total_posts': platform_posts[p]}
-                        for p in platform_counts]
-            platforms.sort(key=lambda x: x['run_count'], reverse=True)
+            # most_common() orders by run count, keeping first-seen order for ties
+            platforms = [{'platform': p, 'run_count': run_count, 'total_posts': platform_posts[p]}
+                        for p, run_count in platform_counts.most_common()]
 
             display = self.query_one("#statistics", Static)
             display.update(self._format_statistics(stats, platforms))
@@ -1352,6 +1429,12 @@ class MainScreen(Screen):
     }
     """
 
+    # Filter types that test a single field; anything else is a content filter
+    FIELD_FILTER_TYPES = ("username", "platform", "min_date", "max_date", "min_engagements")
+    # Substring filter results kept per (column, query), so backspacing and
+    # retyping a query redraws without rescanning
+    FILTER_CACHE_SIZE = 128
+
     BINDINGS = [
         Binding("q", "quit_with_todos", "Quit & Show TODOs", priority=True),
         Binding("t", "view_todos", "View TODOs", priority=True),
@@ -1376,6 +1459,7 @@ class MainScreen(Screen):
         self.posts = []
         self.marked_posts = {}  # Maps post_idx to {"actions": set(), "timestamp": datetime}
         self.post_index_map = {}  # Maps row key to post index
+        self.row_keys_by_index = []  # Row keys in table order, indexed by cursor row
         self.filter_active = False
         self.filter_text = ""
         self.filter_locked = False
@@ -1383,6 +1467,9 @@ class MainScreen(Screen):
         self.show_new_only = False
         self.prefix_mode_active = False # New: Tracks if C-u prefix mode is active
         self.current_filter_type = None # New: Stores the type of filter being applied (e.g., 'username', 'platform', 'content')
+        self._filter_columns = {"username": [], "platform": [], "content": []}  # See _build_filter_columns
+        self._content_index = None  # Trigram index over the content column, built on first content filter
+        self._filter_cache = OrderedDict()  # (column, query) -> matching post indices, least recent first
 
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
@@ -1438,14 +1525,7 @@ class MainScreen(Screen):
                     self.notify("Loading posts from Supabase view...", timeout=10)
                 main_posts_result = main_posts_query.execute()
                 main_posts_data = main_posts_result.data
-                
-                # Fetch raw_json separately for post detail screen, keyed by post_id
-                raw_json_map = {}
-                if main_posts_data:
-                    post_ids_for_raw_json = [row['post_id'] for row in main_posts_data]
-                    raw_json_result = client.table('posts').select('post_id, raw_json').in_('post_id', post_ids_for_raw_json).execute()
-                    for row in raw_json_result.data:
-                        raw_json_map[row['post_id']] = row['raw_json']
+                # The view already carries raw_json, so no second query to posts is needed
 
                 if verbose:
                     self.notify(f"Loaded {len(main_posts_data)} main posts, now loading engagement history...", timeout=10)
@@ -1460,7 +1540,9 @@ class MainScreen(Screen):
                 logger.info(f"Total post_ids extracted: {len(post_ids)}")
 
                 # Separate recent posts (last 15 days) from older posts
-                cutoff_date = datetime.now(timezone.utc) - timedelta(days=15)
+                # posted_at_formatted is like "2025-11-30 22:56:19", which sorts
+                # chronologically as a string, so compare without parsing each row
+                cutoff = (datetime.now(timezone.utc) - timedelta(days=15)).strftime("%Y-%m-%d %H:%M:%S")
                 recent_post_ids = []
                 old_post_ids = []
 
@@ -1471,17 +1553,8 @@ class MainScreen(Screen):
 
                     # Use posted_at_formatted to determine post age (actual post date, not import date)
                     posted_at = row.get('posted_at_formatted')
-                    if posted_at:
-                        try:
-                            # posted_at_formatted is like "2025-11-30 22:56:19"
-                            posted_at_dt = datetime.strptime(posted_at, "%Y-%m-%d %H:%M:%S")
-                            if posted_at_dt >= cutoff_date:
-                                recent_post_ids.append(post_id)
-                            else:
-                                old_post_ids.append(post_id)
-                        except:
-                            # If parsing fails, treat as old (will be lazy loaded)
-                            old_post_ids.append(post_id)
+                    if posted_at and posted_at >= cutoff:
+                        recent_post_ids.append(post_id)
                     else:
                         old_post_ids.append(post_id)
 
@@ -1526,8 +1599,8 @@ class MainScreen(Screen):
                 if verbose:
                     self.notify(f"Processing {len(main_posts_data)} posts...", timeout=5)
                 for row in main_posts_data:
-                    # Use raw_json_map to get the full post data
-                    post = json.loads(raw_json_map.get(row['post_id'], '{}'))
+                    # Use the row's raw_json to get the full post data
+                    post = loads_json(row.get('raw_json') or '{}')
                     post['first_seen_at'] = row['first_seen_at']
                     post['post_id'] = row['post_id']
                     post['text_preview'] = row['text_preview']
@@ -1573,10 +1646,18 @@ class MainScreen(Screen):
                 return []
         else:
             # Legacy file loading
-            json_files = glob.glob(f"{self.data_source}/*.json")
+            # Same matches as glob("*.json"): no hidden files, nothing if the directory is missing
+            try:
+                with os.scandir(self.data_source) as entries:
+                    json_files = [
+                        e.path for e in entries
+                        if e.name.endswith('.json') and not e.name.startswith('.') and e.is_file()
+                    ]
+            except (FileNotFoundError, NotADirectoryError):
+                json_files = []
             for file_path in json_files:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
+                with open(file_path, 'rb') as f:
+                    data = loads_json(f.read())
                     if isinstance(data, list):
                         posts.extend(data)
 
@@ -1615,12 +1696,15 @@ class MainScreen(Screen):
 
 
         # Sort by date, newest first (already handled by view, but good for consistency)
-        self.posts.sort(key=lambda x: datetime.fromisoformat(x.get('posted_at_formatted').replace(' ', 'T')), reverse=True)
+        # posted_at_formatted ("YYYY-MM-DD HH:MM:SS") orders correctly as a string
+        self.posts.sort(key=lambda x: x.get('posted_at_formatted') or '', reverse=True)
+        self._build_filter_columns()
 
         # Populate table
         table = self.query_one(DataTable)
         table.clear()
         self.post_index_map.clear()
+        self.row_keys_by_index.clear()
         
         for idx, post in enumerate(self.posts):
             self._add_post_to_table(idx, post, table)
@@ -1668,9 +1752,9 @@ class MainScreen(Screen):
         table = self.query_one(DataTable)
         cursor_row = table.cursor_row
 
-        # Get all row keys and use the cursor index to find the correct one
+        # Use the cursor index to find the row key (rows are never reordered)
         if cursor_row is not None:
-            row_keys = list(table.rows.keys())
+            row_keys = self.row_keys_by_index
             if cursor_row < len(row_keys):
                 row_key = row_keys[cursor_row]
 
@@ -1702,7 +1786,7 @@ class MainScreen(Screen):
         cursor_row = table.cursor_row
 
         if cursor_row is not None:
-            row_keys = list(table.rows.keys())
+            row_keys = self.row_keys_by_index
             if cursor_row < len(row_keys):
                 row_key = row_keys[cursor_row]
 
@@ -1767,7 +1851,7 @@ class MainScreen(Screen):
         cursor_row = table.cursor_row
 
         if cursor_row is not None:
-            row_keys = list(table.rows.keys())
+            row_keys = self.row_keys_by_index
             if cursor_row < len(row_keys):
                 row_key = row_keys[cursor_row]
                 if row_key in self.post_index_map:
@@ -1954,11 +2038,72 @@ class MainScreen(Screen):
         except Exception as e:
             self.notify(f"Error saving file: {e}", severity="error")
 
+    def _build_filter_columns(self):
+        """Precompute the lowercased strings the substring filters match, one list per filter, in post order."""
+        self._filter_columns = {
+            "username": [(post.get("author_username") or "").lower() for post in self.posts],
+            "platform": [(post.get("platform") or "").lower() for post in self.posts],
+            "content": [get_searchable_text(post) for post in self.posts],
+        }
+        self._content_index = None
+        self._filter_cache.clear()
+
+    def _substring_column_name(self):
+        """Return the filter column for the current filter type, or None for date/engagement filters."""
+        if self.current_filter_type in ("username", "platform"):
+            return self.current_filter_type
+        if self.current_filter_type in self.FIELD_FILTER_TYPES:
+            return None
+        return "content"
+
+    def _cached_prefix_matches(self, column_name: str, filter_lower: str):
+        """Return the cached matches of the longest cached prefix of filter_lower, or None."""
+        for end in range(len(filter_lower) - 1, 0, -1):
+            matches = self._filter_cache.get((column_name, filter_lower[:end]))
+            if matches is not None:
+                return matches
+        return None
+
+    def _substring_matches(self, column_name: str, filter_lower: str) -> list:
+        """Return the indices of posts whose column value contains filter_lower.
+
+        Results are cached per (column, query) until the next load, and a
+        query that extends a cached one (typing another character) only
+        rescans that query's matches.
+        """
+        key = (column_name, filter_lower)
+        matches = self._filter_cache.get(key)
+        if matches is not None:
+            self._filter_cache.move_to_end(key)
+            return matches
+
+        # A query that extends a cached one can only match within its results
+        indices = self._cached_prefix_matches(column_name, filter_lower)
+        if indices is None:
+            indices = range(len(self.posts))
+            if column_name == "content":
+                # Content filter: only posts holding every trigram of the query can match
+                if self._content_index is None:
+                    self._content_index = build_trigram_index(self._filter_columns["content"])
+                candidates = trigram_candidates(self._content_index, filter_lower)
+                if candidates is not None:
+                    indices = sorted(candidates)
+
+        # Substring filters scan one precomputed column of lowercased strings
+        column = self._filter_columns[column_name]
+        matches = [idx for idx in indices if filter_lower in column[idx]]
+
+        self._filter_cache[key] = matches
+        if len(self._filter_cache) > self.FILTER_CACHE_SIZE:
+            self._filter_cache.popitem(last=False)
+        return matches
+
     def apply_filter(self):
         """Apply filter to the posts and refresh the table."""
         table = self.query_one(DataTable)
         table.clear()
         self.post_index_map.clear()
+        self.row_keys_by_index.clear()
 
         count = 0
         if not self.filter_text:
@@ -1969,69 +2114,66 @@ class MainScreen(Screen):
         else:
             filter_lower = self.filter_text.lower()
 
-            for idx, post in enumerate(self.posts):
-                filter_match = False # Assume no match initially
-
-                if self.current_filter_type == "username":
-                    username = post.get("author_username", "").lower()
-                    if filter_lower in username:
-                        filter_match = True
-                elif self.current_filter_type == "platform":
-                    platform = post.get("platform", "").lower()
-                    if filter_lower in platform:
-                        filter_match = True
-                elif self.current_filter_type == "min_date":
-                    try:
-                        # Convert filter text to datetime object
-                        filter_date = datetime.strptime(self.filter_text, "%Y-%m-%d")
-                        post_date_str = post.get("posted_at_formatted", "")
-                        if post_date_str:
-                            # Parse post date, ignore time for min_date comparison
-                            post_date = datetime.strptime(post_date_str.split(" ")[0], "%Y-%m-%d")
-                            if post_date >= filter_date:
-                                filter_match = True
-                    except ValueError:
-                        self.notify(f"Invalid min date format: {self.filter_text}. Use YYYY-MM-DD.", severity="error")
-                        # If date is invalid, no posts match this filter until corrected
-                        continue 
-                elif self.current_filter_type == "max_date":
-                    try:
-                        filter_date = datetime.strptime(self.filter_text, "%Y-%m-%d")
-                        post_date_str = post.get("posted_at_formatted", "")
-                        if post_date_str:
-                            post_date = datetime.strptime(post_date_str.split(" ")[0], "%Y-%m-%d")
-                            if post_date <= filter_date:
-                                filter_match = True
-                    except ValueError:
-                        self.notify(f"Invalid max date format: {self.filter_text}. Use YYYY-MM-DD.", severity="error")
-                        continue
-                elif self.current_filter_type == "min_engagements":
-                    try:
-                        min_engagements = int(self.filter_text)
-                        # Sum reactions, comments, reposts from the latest snapshot
-                        engagement_history = post.get("engagement_history", [])
-                        if engagement_history:
-                            latest_snapshot = engagement_history[-1]
-                            total_engagements = (
-                                latest_snapshot.get("reactions", 0) +
-                                latest_snapshot.get("comments", 0) +
-                                latest_snapshot.get("reposts", 0)
-                            )
-                            if total_engagements >= min_engagements:
+            column_name = self._substring_column_name()
+
+            if column_name is not None:
+                matches = self._substring_matches(column_name, filter_lower)
+                posts = self.posts
+                for idx in matches:
+                    self._add_post_to_table(idx, posts[idx], table)
+                count = len(matches)
+            else:
+                for idx, post in enumerate(self.posts):
+                    filter_match = False # Assume no match initially
+
+                    if self.current_filter_type == "min_date":
+                        try:
+                            # Convert filter text to datetime object
+                            filter_date = datetime.strptime(self.filter_text, "%Y-%m-%d")
+                            post_date_str = post.get("posted_at_formatted", "")
+                            if post_date_str:
+                                # Parse post date, ignore time for min_date comparison
+                                post_date = datetime.strptime(post_date_str.split(" ")[0], "%Y-%m-%d")
+                                if post_date >= filter_date:
+                                    filter_match = True
+                        except ValueError:
+                            self.notify(f"Invalid min date format: {self.filter_text}. Use YYYY-MM-DD.", severity="error")
+                            # If date is invalid, no posts match this filter until corrected
+                            continue 
+                    elif self.current_filter_type == "max_date":
+                        try:
+                            filter_date = datetime.strptime(self.filter_text, "%Y-%m-%d")
+                            post_date_str = post.get("posted_at_formatted", "")
+                            if post_date_str:
+                                post_date = datetime.strptime(post_date_str.split(" ")[0], "%Y-%m-%d")
+                                if post_date <= filter_date:
+                                    filter_match = True
+                        except ValueError:
+                            self.notify(f"Invalid max date format: {self.filter_text}. Use YYYY-MM-DD.", severity="error")
+                            continue
+                    elif self.current_filter_type == "min_engagements":
+                        try:
+                            min_engagements = int(self.filter_text)
+                            # Sum reactions, comments, reposts from the latest snapshot
+                            engagement_history = post.get("engagement_history", [])
+                            if engagement_history:
+                                latest_snapshot = engagement_history[-1]
+                                total_engagements = (
+                                    latest_snapshot.get("reactions", 0) +
+                                    latest_snapshot.get("comments", 0) +
+                                    latest_snapshot.get("reposts", 0)
+                                )
+                                if total_engagements >= min_engagements:
+                                    filter_match = True
+                            elif min_engagements == 0: # If no engagement history, it matches if min_engagements is 0
                                 filter_match = True
-                        elif min_engagements == 0: # If no engagement history, it matches if min_engagements is 0
-                            filter_match = True
-                    except ValueError:
-                        self.notify(f"Invalid minimum engagements number: {self.filter_text}. Enter an integer.", severity="error")
-                        continue
-                else: # Default content filter or if current_filter_type is not recognized/None
-                    searchable = post.get("_searchable", "")
-                    if filter_lower in searchable:
-                        filter_match = True
-
-                if filter_match:
-                    self._add_post_to_table(idx, post, table)
-                    count += 1
+                        except ValueError:
+                            self.notify(f"Invalid minimum engagements number: {self.filter_text}. Enter an integer.", severity="error")
+                            continue
+
+                    if filter_match:
+                        self._add_post_to_table(idx, post, table)
+                        count += 1
                     
         self.update_status_bar(count, len(self.posts))
 
@@ -2059,6 +2201,7 @@ class MainScreen(Screen):
 
         row_key = table.add_row(date_str, username, platform, text_preview, media_indicator, marked_indicator, new_indicator)
         self.post_index_map[row_key] = idx
+        self.row_keys_by_index.append(row_key)
 
 
     def action_quit_with_todos(self):
@@ -2089,7 +2232,6 @@ class MainScreen(Screen):
             mark_info = self.marked_posts[post_idx]
             author = post.get("author", {})
             posted_at = post.get("posted_at", {})
-            text = post.get("text", "")
             url = post.get("url", "N/A")
 
             # Construct name from first_name and last_name if 'name' field doesn't exist
@@ -2103,8 +2245,7 @@ class MainScreen(Screen):
             actions = mark_info["actions"]
             action_list = ", ".join(action_names.get(a, a) for a in sorted(actions))
 
-            # Truncate text for preview
-            text_preview = text[:100] + "..." if len(text) > 100 else text
+            text_preview = get_text_preview(post)
 
             print(f"({idx}) Actions: [{action_list}]")
             print(f"    Author: {author.get('username', 'N/A')}")
@@ -7,34 +7,110 @@ Now uses Supabase with AWS-style identifiers and time-series tracking.
 """
 
 import json
-import glob
 import argparse
+import hashlib
 import os
 import socket
 import logging
+import time
+from collections import deque
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from datetime import datetime, timezone
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 from supabase_client import get_supabase_client
-from db_utils import generate_aws_id, PREFIX_POST, PREFIX_DOWNLOAD, PREFIX_RUN, PREFIX_MEDIA
+from db_utils import generate_aws_id, iter_aws_ids, PREFIX_POST, PREFIX_DOWNLOAD, PREFIX_RUN, PREFIX_MEDIA
 from media_cache import download_and_cache_media, download_multiple_media
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Hostname recorded on download runs (looked up once per process)
+_HOSTNAME = socket.gethostname()
+
+
+def load_json_file(fpath):
+    """Parse a JSON file, using orjson when it is installed.
+
+    The file is read as bytes in one call and handed to the parser directly,
+    so the text is never decoded into an intermediate str.
+    """
+    with open(fpath, 'rb') as f:
+        raw = f.read()
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dump_json(obj):
+    """Serialize obj to compact JSON text, using orjson when it is installed.
+
+    Falls back to the stdlib encoder for values orjson rejects (e.g. integers
+    wider than 64 bits).
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def list_json_files(directory):
+    """List the paths of the *.json files directly inside directory.
+
+    Uses os.scandir so each entry's type comes from the directory listing
+    instead of a separate stat call per file. Matches glob("*.json"): hidden
+    files (e.g. macOS ._* AppleDouble files) are skipped, and a missing
+    directory yields no files.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                entry.path for entry in entries
+                if entry.name.endswith('.json')
+                and not entry.name.startswith('.')
+                and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def file_sha256(fpath):
+    """Return the hex SHA-256 digest of a file's contents."""
+    with open(fpath, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
 
 def get_post_urn(post):
     """Extract the best URN from a post object."""
     urn = post.get('full_urn')
-    if not urn and 'urn' in post:
-        if isinstance(post['urn'], dict):
-            urn = post['urn'].get('activity_urn') or post['urn'].get('ugcPost_urn')
-        else:
-            urn = post['urn']
+    if urn:
+        return urn
+    urn = post.get('urn', urn)
+    if isinstance(urn, dict):
+        return urn.get('activity_urn') or urn.get('ugcPost_urn')
     return urn
 
 
+@lru_cache(maxsize=None)
+def _system_info(script_name, platform):
+    """Serialized system_info for a download run; constant within a process."""
+    return json.dumps({
+        "hostname": _HOSTNAME,
+        "platform": platform,
+        "script": script_name,
+    })
+
+
 def create_download_run(client, script_name="import", platform="linkedin"):
     """Create a new download run record.
 
@@ -47,21 +123,18 @@ def create_download_run(client, script_name="import", platform="linkedin"):
         run_id: The ID of the created run
     """
     run_id = generate_aws_id(PREFIX_RUN)
+    now_iso = datetime.now(timezone.utc).isoformat()
 
-    system_info = json.dumps({
-        "hostname": socket.gethostname(),
-        "platform": platform,
-        "script": script_name,
-    })
+    system_info = _system_info(script_name, platform)
 
     client.table('download_runs').insert({
         'run_id': run_id,
-        'started_at': datetime.now(timezone.utc).isoformat(),
+        'started_at': now_iso,
         'status': 'running',
         'script_name': script_name,
         'platform': platform,
         'system_info': system_info,
-        'created_at': datetime.now(timezone.utc).isoformat()
+        'created_at': now_iso
     }).execute()
 
     return run_id
@@ -166,10 +239,11 @@ def extract_and_store_media(client, post_id: str, post_data: dict) -> dict:
 
             # Create media_id
             media_id = generate_aws_id(PREFIX_MEDIA)
+            now_iso = datetime.now(timezone.utc).isoformat()
 
             # Initialize ai_analysis_log
             ai_log = [{
-                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'timestamp': now_iso,
                 'event': 'media_downloaded',
                 'status': 'success',
                 'details': {
@@ -186,6 +260,7 @@ def extract_and_store_media(client, post_id: str, post_data: dict) -> dict:
                 'media_type': result['media_type'],
                 'media_url': url,
                 'local_file_path': str(result['local_path']),
+                'file_extension': Path(result['local_path']).suffix.lstrip('.') or None,
                 'md5_sum': result['md5_sum'],
                 'file_size': result['file_size'],
                 'mime_type': result.get('mime_type'),
@@ -193,8 +268,8 @@ def extract_and_store_media(client, post_id: str, post_data: dict) -> dict:
                 'height': result.get('height'),
                 'ai_analysis_status': 'not_started',
                 'ai_analysis_log': json.dumps(ai_log),
-                'created_at': datetime.now(timezone.utc).isoformat(),
-                'updated_at': datetime.now(timezone.utc).isoformat()
+                'created_at': now_iso,
+                'updated_at': now_iso
             }).execute()
 
             stats['media_ids'].append(media_id)
@@ -210,18 +285,309 @@ def extract_and_store_media(client, post_id: str, post_data: dict) -> dict:
     return stats
 
 
-def import_directory(client, directory, run_id=None):
+# Imports with at least this many files parse them in a process pool
+PARALLEL_PARSE_MIN_FILES = 16
+
+# Files parsed per pool task, and parse tasks queued ahead per worker
+PARSE_BATCH_SIZE = 8
+PARSE_BATCHES_PER_WORKER = 2
+
+# Maximum number of rows sent in a single Supabase insert request
+INSERT_BATCH_SIZE = 500
+
+# Maximum number of URNs per lookup query (values are sent in the request URL)
+LOOKUP_BATCH_SIZE = 100
+
+
+def _parse_file(fpath):
+    """Load a JSON file for import.
+
+    Runs in a worker process when files are parsed in parallel, so errors are
+    returned as strings rather than raised.
+
+    Returns:
+        Tuple of (fpath, data, error) where error is None on success
+    """
+    try:
+        return fpath, load_json_file(fpath), None
+    except Exception as e:
+        return fpath, None, str(e)
+
+
+def _parse_files(files):
+    """Run _parse_file over a batch of files (one pool task per batch)."""
+    return [_parse_file(fpath) for fpath in files]
+
+
+def _iter_parsed_files(files):
+    """Yield _parse_file results for files, in order.
+
+    Large imports parse in a process pool while the caller, the only writer,
+    consumes results; small imports are parsed inline to avoid the pool
+    startup cost. Only PARSE_BATCHES_PER_WORKER batches per worker are in
+    flight at a time, so a slow writer doesn't accumulate every parsed file
+    in memory.
+    """
+    if len(files) < PARALLEL_PARSE_MIN_FILES:
+        for fpath in files:
+            yield _parse_file(fpath)
+        return
+
+    # Under fork (Linux) the pool starts every worker at once, so don't ask
+    # for more workers than there are batches to parse
+    batch_count = -(-len(files) // PARSE_BATCH_SIZE)
+    workers = min(os.process_cpu_count() or 1, batch_count)
+    batches = (
+        files[i:i + PARSE_BATCH_SIZE]
+        for i in range(0, len(files), PARSE_BATCH_SIZE)
+    )
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque(
+            pool.submit(_parse_files, batch)
+            for batch in islice(batches, workers * PARSE_BATCHES_PER_WORKER)
+        )
+        while pending:
+            results = pending.popleft().result()
+            batch = next(batches, None)
+            if batch is not None:
+                pending.append(pool.submit(_parse_files, batch))
+            yield from results
+
+
+def _insert_rows(client, table, rows):
+    """Insert rows in batches of INSERT_BATCH_SIZE.
+
+    If a batch is rejected, its rows are retried one at a time so that a
+    single bad row does not fail the rest of the batch.
+
+    Args:
+        client: Supabase client
+        table: Name of the table to insert into
+        rows: List of row dictionaries
+
+    Returns:
+        List of (row, exception) tuples for the rows that could not be inserted
+    """
+    failed = []
+    for i in range(0, len(rows), INSERT_BATCH_SIZE):
+        batch = rows[i:i + INSERT_BATCH_SIZE]
+        try:
+            client.table(table).insert(batch).execute()
+        except Exception:
+            for row in batch:
+                try:
+                    client.table(table).insert(row).execute()
+                except Exception as e:
+                    failed.append((row, e))
+    return failed
+
+
+def _fetch_existing_post_ids(client, urns):
+    """Look up the post_ids of already-stored posts by URN.
+
+    Args:
+        client: Supabase client
+        urns: Iterable of post URNs
+
+    Returns:
+        Dictionary mapping URN to post_id for the URNs that exist
+    """
+    urns = list(dict.fromkeys(urns))
+    existing = {}
+    for i in range(0, len(urns), LOOKUP_BATCH_SIZE):
+        result = client.table('posts').select('urn, post_id').in_(
+            'urn', urns[i:i + LOOKUP_BATCH_SIZE]
+        ).execute()
+        for row in result.data:
+            existing[row['urn']] = row['post_id']
+    return existing
+
+
+def _fetch_imported_hashes(client, hashes):
+    """Look up which file hashes have already been imported.
+
+    Args:
+        client: Supabase client
+        hashes: List of file SHA-256 hex digests
+
+    Returns:
+        Set of the digests present in imported_files; empty if the
+        imported_files table is unavailable (every file is then imported)
+    """
+    imported = set()
+    try:
+        for i in range(0, len(hashes), LOOKUP_BATCH_SIZE):
+            result = client.table('imported_files').select('file_sha256').in_(
+                'file_sha256', hashes[i:i + LOOKUP_BATCH_SIZE]
+            ).execute()
+            imported.update(row['file_sha256'] for row in result.data)
+    except Exception as e:
+        logger.warning(f"imported_files unavailable, importing every file: {e}")
+        return set()
+    return imported
+
+
+def _add_media_stats(stats, media_stats):
+    """Accumulate per-post media stats into the import stats."""
+    stats["media_total"] += media_stats['media_count']
+    stats["media_cached"] += media_stats['media_cached']
+    stats["media_errors"] += media_stats['media_errors']
+
+
+def _import_posts(client, data, fpath, run_id, stats, now_iso, download_ids):
+    """Import the posts loaded from a single JSON file.
+
+    New posts and data_download rows are collected and written with batched
+    inserts; media extraction runs once the owning post rows exist.
+
+    Args:
+        client: Supabase client
+        data: List of post dictionaries
+        fpath: Path of the source file (recorded on each data_download)
+        run_id: Download run ID
+        stats: Import statistics dictionary, updated in place
+        now_iso: ISO timestamp recorded on every row of the import
+        download_ids: Iterator yielding download_ids for this import
+    """
+    new_post_rows = []
+    new_posts = []  # (post_id, post, urn) for posts queued for insertion
+    existing_posts = []  # (post_id, post, urn) for posts already in the database
+    downloads = []  # (urn, data_download row)
+    post_ids_by_urn = {}  # posts seen earlier in this file
+
+    # Check which posts already exist with one query per LOOKUP_BATCH_SIZE URNs
+    urns = [urn for urn in map(get_post_urn, data) if urn]
+    stats["urns_probed"] += len(urns)
+    existing_ids = _fetch_existing_post_ids(client, urns)
+
+    for post in data:
+        stats["processed"] += 1
+        urn = get_post_urn(post)
+
+        if not urn:
+            print(f"Warning: No URN found for post in {fpath}")
+            stats["errors"] += 1
+            continue
+
+        post_id = post_ids_by_urn.get(urn)
+        if post_id is not None:
+            # Repeated within this file - only record another data_download
+            stats["duplicates"] += 1
+        else:
+            post_id = existing_ids.get(urn)
+
+            if post_id is not None:
+                # Post exists - create a new data_download entry for time-series
+                stats["duplicates"] += 1
+                existing_posts.append((post_id, post, urn))
+            else:
+                # New post - create post and data_download
+                post_id = generate_aws_id(PREFIX_POST)
+
+                # Extract metadata for columns
+                author = post.get('author', {})
+                username = author.get('username', '')
+                text = post.get('text', '')
+                posted_at = post.get('posted_at', {})
+                timestamp = posted_at.get('timestamp')
+                post_type = post.get('post_type', 'regular')
+                url = post.get('url')
+
+                new_post_rows.append({
+                    'post_id': post_id,
+                    'urn': urn,
+                    'full_urn': post.get('full_urn'),
+                    'platform': 'linkedin',
+                    'posted_at_timestamp': timestamp,
+                    'author_username': username,
+                    'text_content': text,
+                    'post_type': post_type,
+                    'url': url,
+                    'raw_json': dump_json(post),
+                    'first_seen_at': now_iso,
+                    'is_read': False,
+                    'is_marked': False,
+                    'created_at': now_iso,
+                    'updated_at': now_iso
+                })
+                new_posts.append((post_id, post, urn))
+
+            post_ids_by_urn[urn] = post_id
+
+        # Create data_download entry (for both new and existing posts)
+        download_id = next(download_ids)
+
+        # Extract stats
+        stats_data = post.get('stats', {})
+        total_reactions = stats_data.get('total_reactions', 0)
+
+        downloads.append((urn, {
+            'download_id': download_id,
+            'post_id': post_id,
+            'run_id': run_id,
+            'downloaded_at': now_iso,
+            'total_reactions': total_reactions,
+            'stats_json': dump_json(stats_data),
+            'source_file_path': fpath,
+            'created_at': now_iso
+        }))
+
+    # Insert new posts
+    failed_urns = set()
+    for row, e in _insert_rows(client, 'posts', new_post_rows):
+        print(f"Error inserting post {row['urn']}: {e}")
+        stats["errors"] += 1
+        failed_urns.add(row['urn'])
+    stats["new"] += len(new_post_rows) - len(failed_urns)
+
+    # Extract and store media for new posts
+    for post_id, post, urn in new_posts:
+        if urn in failed_urns:
+            continue
+        try:
+            media_stats = extract_and_store_media(client, post_id, post)
+            _add_media_stats(stats, media_stats)
+            if media_stats['media_cached'] > 0:
+                print(f"  └─ Cached {media_stats['media_cached']} media item(s)")
+        except Exception as e:
+            logger.error(f"Error extracting media for post {urn}: {e}")
+            # Don't fail the post import for media errors
+
+    # Extract and store media for existing posts (if not already stored)
+    for post_id, post, urn in existing_posts:
+        try:
+            _add_media_stats(stats, extract_and_store_media(client, post_id, post))
+        except Exception as e:
+            logger.debug(f"Error extracting media for existing post {urn}: {e}")
+            # Don't fail for media errors on existing posts
+
+    # Insert data_downloads, skipping posts that failed to insert
+    download_rows = [row for urn, row in downloads if urn not in failed_urns]
+    failed_downloads = _insert_rows(client, 'data_downloads', download_rows)
+    for row, e in failed_downloads:
+        print(f"Error creating data_download for post {row['post_id']}: {e}")
+        stats["errors"] += 1
+    stats["downloads_new"] += len(download_rows) - len(failed_downloads)
+
+
+def import_directory(client, directory, run_id=None, files=None):
     """Import all JSON files from a directory.
 
     Args:
         client: Supabase client
         directory: Directory containing JSON files
         run_id: Optional download run ID (will create one if not provided)
+        files: Optional list of the directory's JSON file paths, when the
+            caller has already listed them
 
     Returns:
         Dictionary with import statistics and run_id
     """
-    files = glob.glob(f"{directory}/*.json")
+    if files is None:
+        files = list_json_files(directory)
+    else:
+        files = [str(fpath) for fpath in files]
     print(f"Scanning {len(files)} files in {directory}...")
 
     # Create download run if not provided
@@ -234,16 +600,57 @@ def import_directory(client, directory, run_id=None):
         "new": 0,
         "duplicates": 0,
         "errors": 0,
+        "files_found": len(files),
+        "files_skipped": 0,
+        "urns_probed": 0,
+        "downloads_new": 0,
+        "parse_seconds": 0.0,
+        "import_seconds": 0.0,
         "media_total": 0,
         "media_cached": 0,
         "media_errors": 0
     }
 
+    # Skip files whose exact contents were imported before
+    hashes = {}
     for fpath in files:
         try:
-            with open(fpath, 'r') as f:
-                data = json.load(f)
+            hashes[fpath] = file_sha256(fpath)
+        except OSError as e:
+            print(f"Error processing {fpath}: {e}")
+            stats["errors"] += 1
+    files = list(hashes)
+
+    imported = _fetch_imported_hashes(client, list(set(hashes.values())))
+    if imported:
+        files = [fpath for fpath in files if hashes[fpath] not in imported]
+        stats["files_skipped"] = len(hashes) - len(files)
+        print(f"Skipping {stats['files_skipped']} already imported file(s)")
+
+    # All rows written by this import share one timestamp
+    now_iso = datetime.now(timezone.utc).isoformat()
+
+    # Download IDs are consecutive from a random base, unique within the run
+    download_ids = iter_aws_ids(PREFIX_DOWNLOAD)
+
+    imported_rows = {}  # file_sha256 -> imported_files row
+    parsed_files = _iter_parsed_files(files)
+    while True:
+        # Time spent waiting on the parser vs. writing to the database
+        started = time.perf_counter()
+        parsed = next(parsed_files, None)
+        stats["parse_seconds"] += time.perf_counter() - started
+        if parsed is None:
+            break
+
+        fpath, data, error = parsed
+        if error is not None:
+            print(f"Error processing {fpath}: {error}")
+            stats["errors"] += 1
+            continue
 
+        errors_before = stats["errors"]
+        try:
             if not isinstance(data, list):
                 # Handle single object files if necessary
                 if isinstance(data, dict):
@@ -251,113 +658,72 @@ def import_directory(client, directory, run_id=None):
                 else:
                     continue
 
-            for post in data:
-                stats["processed"] += 1
-                urn = get_post_urn(post)
-
-                if not urn:
-                    print(f"Warning: No URN found for post in {fpath}")
-                    stats["errors"] += 1
-                    continue
-
-                # Check if post already exists
-                existing_result = client.table('posts').select('post_id').eq('urn', urn).execute()
-                existing = existing_result.data
-
-                if existing:
-                    # Post exists - create a new data_download entry for time-series
-                    post_id = existing[0]['post_id']
-                    stats["duplicates"] += 1
-
-                    # Extract and store media for existing posts (if not already stored)
-                    try:
-                        media_stats = extract_and_store_media(client, post_id, post)
-                        stats["media_total"] += media_stats['media_count']
-                        stats["media_cached"] += media_stats['media_cached']
-                        stats["media_errors"] += media_stats['media_errors']
-                    except Exception as e:
-                        logger.debug(f"Error extracting media for existing post {urn}: {e}")
-                        # Don't fail for media errors on existing posts
-                else:
-                    # New post - create post and data_download
-                    post_id = generate_aws_id(PREFIX_POST)
-
-                    # Extract metadata for columns
-                    author = post.get('author', {})
-                    username = author.get('username', '')
-                    text = post.get('text', '')
-                    posted_at = post.get('posted_at', {})
-                    timestamp = posted_at.get('timestamp')
-                    post_type = post.get('post_type', 'regular')
-                    url = post.get('url')
-
-                    try:
-                        client.table('posts').insert({
-                            'post_id': post_id,
-                            'urn': urn,
-                            'full_urn': post.get('full_urn'),
-                            'platform': 'linkedin',
-                            'posted_at_timestamp': timestamp,
-                            'author_username': username,
-                            'text_content': text,
-                            'post_type': post_type,
-                            'url': url,
-                            'raw_json': json.dumps(post),
-                            'first_seen_at': datetime.now(timezone.utc).isoformat(),
-                            'is_read': False,
-                            'is_marked': False,
-                            'created_at': datetime.now(timezone.utc).isoformat(),
-                            'updated_at': datetime.now(timezone.utc).isoformat()
-                        }).execute()
-                        stats["new"] += 1
-
-                        # Extract and store media for new posts
-                        try:
-                            media_stats = extract_and_store_media(client, post_id, post)
-                            stats["media_total"] += media_stats['media_count']
-                            stats["media_cached"] += media_stats['media_cached']
-                            stats["media_errors"] += media_stats['media_errors']
-                            if media_stats['media_cached'] > 0:
-                                print(f"  └─ Cached {media_stats['media_cached']} media item(s)")
-                        except Exception as e:
-                            logger.error(f"Error extracting media for post {urn}: {e}")
-                            # Don't fail the post import for media errors
-
-                    except Exception as e:
-                        print(f"Error inserting post {urn}: {e}")
-                        stats["errors"] += 1
-                        continue
-
-                # Create data_download entry (for both new and existing posts)
-                download_id = generate_aws_id(PREFIX_DOWNLOAD)
-
-                # Extract stats
-                stats_data = post.get('stats', {})
-                total_reactions = stats_data.get('total_reactions', 0)
-
-                try:
-                    client.table('data_downloads').insert({
-                        'download_id': download_id,
-                        'post_id': post_id,
-                        'run_id': run_id,
-                        'downloaded_at': datetime.now(timezone.utc).isoformat(),
-                        'total_reactions': total_reactions,
-                        'stats_json': json.dumps(stats_data),
-                        'raw_json': json.dumps(post),
-                        'source_file_path': fpath,
-                        'created_at': datetime.now(timezone.utc).isoformat()
-                    }).execute()
-                except Exception as e:
-                    print(f"Error creating data_download for {urn}: {e}")
-                    stats["errors"] += 1
+            started = time.perf_counter()
+            _import_posts(client, data, fpath, run_id, stats, now_iso, download_ids)
+            stats["import_seconds"] += time.perf_counter() - started
 
         except Exception as e:
             print(f"Error processing {fpath}: {e}")
             stats["errors"] += 1
 
+        # Only files imported cleanly are skipped next time
+        if stats["errors"] == errors_before:
+            imported_rows[hashes[fpath]] = {
+                'file_sha256': hashes[fpath],
+                'source_file_path': fpath,
+                'run_id': run_id,
+                'imported_at': now_iso
+            }
+
+    if imported_rows:
+        try:
+            client.table('imported_files').upsert(
+                list(imported_rows.values()),
+                on_conflict='file_sha256',
+                ignore_duplicates=True,
+                returning='minimal'
+            ).execute()
+        except Exception as e:
+            logger.warning(f"Could not record imported files (they will be re-imported next time): {e}")
+
     return stats, run_id
 
 
+def get_database_stats(client):
+    """Get the overall post, download and run counts.
+
+    Uses the database_stats RPC (one request); falls back to individual
+    count queries if the function is not installed.
+
+    Args:
+        client: Supabase client
+
+    Returns:
+        Dictionary with total_posts, marked_posts, data_downloads and
+        download_runs counts
+    """
+    try:
+        rows = client.rpc('database_stats').execute().data
+    except Exception as e:
+        logger.warning(f"database_stats RPC unavailable ({e}), using count queries")
+        return _get_database_stats_by_count(client)
+
+    return rows[0]
+
+
+def _get_database_stats_by_count(client):
+    """Compute get_database_stats' result with one count query per figure."""
+    def count(query):
+        return query.execute().count or 0
+
+    return {
+        'total_posts': count(client.table('posts').select('post_id', count='exact', head=True)),
+        'marked_posts': count(client.table('posts').select('post_id', count='exact', head=True).eq('is_marked', True)),
+        'data_downloads': count(client.table('data_downloads').select('download_id', count='exact', head=True)),
+        'download_runs': count(client.table('download_runs').select('run_id', count='exact', head=True)),
+    }
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Manage LinkedIn posts data")
@@ -388,6 +754,7 @@ def main():
                 print(f"New:        {stats['new']}")
                 print(f"Duplicates: {stats['duplicates']}")
                 print(f"Errors:     {stats['errors']}")
+                print(f"Skipped:    {stats['files_skipped']} file(s) already imported")
                 print(f"\nMedia:")
                 print(f"  Found:    {stats['media_total']}")
                 print(f"  Cached:   {stats['media_cached']}")
@@ -396,25 +763,13 @@ def main():
                 print(f"Error: Directory not found: {args.directory}")
 
         elif args.command == "stats":
-            # Post stats
-            total_posts_result = client.table('posts').select('post_id', count='exact').execute()
-            total_posts = total_posts_result.count if total_posts_result.count is not None else 0
-
-            marked_result = client.table('posts').select('post_id', count='exact').eq('is_marked', True).execute()
-            marked = marked_result.count if marked_result.count is not None else 0
-
-            # Download stats
-            total_downloads_result = client.table('data_downloads').select('download_id', count='exact').execute()
-            total_downloads = total_downloads_result.count if total_downloads_result.count is not None else 0
-
-            total_runs_result = client.table('download_runs').select('run_id', count='exact').execute()
-            total_runs = total_runs_result.count if total_runs_result.count is not None else 0
+            db_stats = get_database_stats(client)
 
             print(f"\nDatabase Statistics:")
-            print(f"Total Posts:     {total_posts}")
-            print(f"Marked Posts:    {marked}")
-            print(f"Data Downloads:  {total_downloads}")
-            print(f"Download Runs:   {total_runs}")
+            print(f"Total Posts:     {db_stats['total_posts']}")
+            print(f"Marked Posts:    {db_stats['marked_posts']}")
+            print(f"Data Downloads:  {db_stats['data_downloads']}")
+            print(f"Download Runs:   {db_stats['download_runs']}")
 
             # Note: Supabase doesn't support GROUP BY date() function directly
             # We'd need to fetch all posts and group them in Python if needed
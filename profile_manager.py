@@ -1,6 +1,7 @@
 """Profile management for social-tui with AWS-style identifiers."""
 
 import csv
+import heapq
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Dict, Optional, Any
@@ -8,6 +9,9 @@ from typing import List, Dict, Optional, Any
 from supabase_client import get_supabase_client
 from db_utils import generate_aws_id, PREFIX_PROFILE
 
+# Rows per ranged request; PostgREST caps an unranged select at max_rows (1000 by default)
+PAGE_SIZE = 1000
+
 
 class ProfileManager:
     """Manages profile data in Supabase database with AWS-style IDs."""
@@ -31,19 +35,24 @@ class ProfileManager:
         Raises:
             Exception: If username already exists
         """
-        profile_id = generate_aws_id(PREFIX_PROFILE)
+        row = self._new_profile_row(username, name, notes, platform)
+        self.client.table('profiles').insert(row).execute()
+        return row['profile_id']
+
+    @staticmethod
+    def _new_profile_row(username: str, name: str, notes: str = "",
+                         platform: str = "linkedin") -> Dict[str, Any]:
+        """Build the insert row for a new profile with a fresh AWS-style ID.
 
-        self.client.table('profiles').insert({
-            'profile_id': profile_id,
+        created_at/updated_at are left to the column defaults.
+        """
+        return {
+            'profile_id': generate_aws_id(PREFIX_PROFILE),
             'username': username,
             'name': name,
             'platform': platform,
-            'notes': notes,
-            'created_at': datetime.now(timezone.utc).isoformat(),
-            'updated_at': datetime.now(timezone.utc).isoformat()
-        }).execute()
-
-        return profile_id
+            'notes': notes
+        }
 
     def delete_profile(self, profile_id: str) -> bool:
         """Delete a profile from the database.
@@ -54,8 +63,28 @@ class ProfileManager:
         Returns:
             True if profile was deleted, False if not found
         """
-        result = self.client.table('profiles').delete().eq('profile_id', profile_id).execute()
-        return len(result.data) > 0
+        return self.delete_profiles([profile_id]) > 0
+
+    def delete_profiles(self, profile_ids: List[str]) -> int:
+        """Delete several profiles with one request per chunk of IDs.
+
+        Args:
+            profile_ids: IDs of the profiles to delete
+
+        Returns:
+            Number of profiles deleted
+        """
+        if not profile_ids:
+            return 0
+
+        deleted = 0
+        # IDs are sent in the request URL, so delete them in chunks
+        for i in range(0, len(profile_ids), 100):
+            result = self.client.table('profiles').delete().in_(
+                'profile_id', profile_ids[i:i + 100]
+            ).execute()
+            deleted += len(result.data)
+        return deleted
 
     def update_profile(self, profile_id: str, **kwargs) -> bool:
         """Update profile fields.
@@ -100,6 +129,26 @@ class ProfileManager:
         result = self.client.table('profiles').select('*').eq('username', username).execute()
         return result.data[0] if result.data else None
 
+    def _get_profile_ids_by_username(self, usernames: List[str]) -> Dict[str, str]:
+        """Map usernames to profile IDs for the profiles that exist.
+
+        Args:
+            usernames: Usernames to look up
+
+        Returns:
+            Dictionary of username -> profile_id
+        """
+        usernames = list(dict.fromkeys(usernames))
+        existing = {}
+        # Usernames are sent in the request URL, so look them up in chunks
+        for i in range(0, len(usernames), 100):
+            result = self.client.table('profiles').select('profile_id, username').in_(
+                'username', usernames[i:i + 100]
+            ).execute()
+            for profile in result.data:
+                existing[profile['username']] = profile['profile_id']
+        return existing
+
     def get_all_profiles(self, active_only: bool = False) -> List[Dict[str, Any]]:
         """Get all profiles from the database.
 
@@ -134,19 +183,16 @@ class ProfileManager:
 
         tag_id = tag_result.data[0]['tag_id']
 
-        # Get profile_ids that have this tag
-        pt_result = self.client.table('profile_tags').select('profile_id').eq('tag_id', tag_id).execute()
-        if not pt_result.data:
-            return []
-
-        profile_ids = [pt['profile_id'] for pt in pt_result.data]
-
-        # Get profiles
-        profiles_result = self.client.table('profiles').select('*').in_('profile_id', profile_ids).order('created_at', desc=True).execute()
+        # Filter profiles on the resolved tag_id through an inner embed, so
+        # profile_tags is read via its (tag_id, profile_id) index in the same request
+        profiles_result = self.client.table('profiles').select(
+            '*, profile_tags!inner(tag_id)'
+        ).eq('profile_tags.tag_id', tag_id).order('created_at', desc=True).execute()
         profiles = profiles_result.data
 
-        # Add post counts
+        # Drop the embedded join rows and add post counts
         for profile in profiles:
+            profile.pop('profile_tags', None)
             posts_result = self.client.table('posts').select('post_id', count='exact').eq('author_username', profile['username']).execute()
             profile['post_count'] = posts_result.count if posts_result.count is not None else 0
 
@@ -165,33 +211,72 @@ class ProfileManager:
         if not tag_names:
             return self.get_all_profiles()
 
-        # Get all profiles from the optimized view
-        all_profiles = self.get_all_profiles()
-
-        # Filter profiles based on tags (client-side filtering)
         # Normalize tag names for comparison
         search_tags = set(tag.lower() for tag in tag_names)
 
-        matching_profiles = []
-        for profile in all_profiles:
-            # Extract tag names from the tags JSON array
-            profile_tag_names = set()
-            if profile.get('tags'):
-                for tag in profile['tags']:
-                    if isinstance(tag, dict) and 'name' in tag:
-                        profile_tag_names.add(tag['name'].lower())
-
-            # Check if profile matches the filter criteria
-            if match_all:
-                # Profile must have ALL tags
-                if search_tags.issubset(profile_tag_names):
-                    matching_profiles.append(profile)
-            else:
-                # Profile must have ANY tag
-                if search_tags.intersection(profile_tag_names):
-                    matching_profiles.append(profile)
+        # Resolve tag names to IDs
+        tags_result = self.client.table('tags').select('tag_id').in_('name', list(search_tags)).execute()
+        tag_ids = [tag['tag_id'] for tag in tags_result.data]
+        if not tag_ids or (match_all and len(tag_ids) < len(search_tags)):
+            return []
+
+        # Postings per tag: tag_id -> set of profile_ids
+        postings = self._get_tag_postings(tag_ids)
 
-        return matching_profiles
+        if match_all:
+            # Profile must have ALL tags
+            profile_ids = list(set.intersection(*(postings.get(tag_id, set()) for tag_id in tag_ids)))
+        else:
+            # Profile must have ANY tag
+            profile_ids = list(set().union(*postings.values()))
+
+        return self._get_profiles_from_view(profile_ids)
+
+    def _get_tag_postings(self, tag_ids: List[str]) -> Dict[str, set]:
+        """Fetch the set of tagged profile IDs for each tag.
+
+        Reads profile_tags in PAGE_SIZE ranged requests so tags with more
+        profiles than the server's row cap are not silently truncated.
+
+        Args:
+            tag_ids: Tag IDs to fetch postings for
+
+        Returns:
+            Dictionary mapping tag_id to the set of profile_ids carrying it
+        """
+        postings: Dict[str, set] = {}
+        offset = 0
+        while True:
+            # range() adds to the builder it is called on, so build each page's query afresh
+            page = self.client.table('profile_tags').select('tag_id, profile_id').in_(
+                'tag_id', tag_ids
+            ).order('tag_id').order('profile_id').range(offset, offset + PAGE_SIZE - 1).execute().data
+            for pt in page:
+                postings.setdefault(pt['tag_id'], set()).add(pt['profile_id'])
+            if len(page) < PAGE_SIZE:
+                return postings
+            offset += PAGE_SIZE
+
+    def _get_profiles_from_view(self, profile_ids: List[str]) -> List[Dict[str, Any]]:
+        """Fetch rows of v_profiles_with_stats for the given profile IDs.
+
+        Args:
+            profile_ids: Profile IDs to fetch
+
+        Returns:
+            List of profile dictionaries with post_count and tags fields,
+            ordered by name
+        """
+        chunks = []
+        # IDs are sent in the request URL, so fetch them in chunks
+        for i in range(0, len(profile_ids), 100):
+            result = self.client.table('v_profiles_with_stats').select('*').in_(
+                'profile_id', profile_ids[i:i + 100]
+            ).order('name').execute()
+            chunks.append(result.data)
+
+        # Each chunk is name-ordered; merge them into one name-ordered list
+        return list(heapq.merge(*chunks, key=lambda profile: profile.get('name') or ''))
 
     def sync_from_csv(self, csv_path: str = "data/input-data.csv") -> Dict[str, int]:
         """Import profiles from CSV file. Updates existing profiles by username.
@@ -209,32 +294,50 @@ class ProfileManager:
             return stats
 
         with open(csv_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                # Skip empty rows
-                if not row.get('username') or not row.get('name'):
-                    stats["skipped"] += 1
-                    continue
-
-                username = row['username'].strip()
-                name = row['name'].strip()
-
-                # Check if profile exists
-                existing = self.get_profile_by_username(username)
-
-                if existing:
-                    # Update existing profile
-                    self.update_profile(
-                        existing['profile_id'],
-                        name=name,
-                        last_synced_at=datetime.now(timezone.utc).isoformat()
-                    )
-                    stats["updated"] += 1
-                else:
-                    # Add new profile
-                    self.add_profile(username, name)
-                    stats["added"] += 1
+            rows = list(csv.DictReader(f))
+
+        # Look up all CSV usernames in a few queries instead of one per row
+        usernames = [row['username'].strip() for row in rows if row.get('username') and row.get('name')]
+        existing_ids = self._get_profile_ids_by_username(usernames)
+
+        now_iso = datetime.now(timezone.utc).isoformat()
+        to_insert = {}  # username -> new profile row
+        to_update = {}  # username -> update row
+
+        for row in rows:
+            # Skip empty rows
+            if not row.get('username') or not row.get('name'):
+                stats["skipped"] += 1
+                continue
+
+            username = row['username'].strip()
+            name = row['name'].strip()
+
+            if username in existing_ids:
+                # Update existing profile
+                to_update[username] = {
+                    'profile_id': existing_ids[username],
+                    'username': username,
+                    'name': name,
+                    'last_synced_at': now_iso,
+                    'updated_at': now_iso
+                }
+                stats["updated"] += 1
+            elif username in to_insert:
+                # Repeated in the CSV - the last name wins, as with an update
+                to_insert[username]['name'] = name
+                stats["updated"] += 1
+            else:
+                # Add new profile
+                to_insert[username] = self._new_profile_row(username, name)
+                stats["added"] += 1
+
+        if to_insert:
+            self.client.table('profiles').insert(list(to_insert.values())).execute()
+        if to_update:
+            self.client.table('profiles').upsert(
+                list(to_update.values()), on_conflict='profile_id'
+            ).execute()
 
         return stats
 
@@ -245,20 +348,19 @@ class ProfileManager:
             csv_path: Path to CSV file
             active_only: If True, only export active profiles
         """
-        profiles = self.get_all_profiles(active_only=active_only)
+        # Only the exported columns are needed, so skip the stats view
+        query = self.client.table('profiles').select('name, username')
+        if active_only:
+            query = query.eq('is_active', True)
+        profiles = query.order('name').execute().data
 
         # Ensure directory exists
         Path(csv_path).parent.mkdir(parents=True, exist_ok=True)
 
         with open(csv_path, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=['name', 'username'])
-            writer.writeheader()
-
-            for profile in profiles:
-                writer.writerow({
-                    'name': profile['name'],
-                    'username': profile['username']
-                })
+            writer = csv.writer(f)
+            writer.writerow(['name', 'username'])
+            writer.writerows((profile['name'], profile['username']) for profile in profiles)
 
     def get_profile_count(self) -> int:
         """Get total number of profiles.
@@ -281,17 +383,11 @@ class ProfileManager:
         # Supabase uses ilike for case-insensitive LIKE queries
         search_pattern = f"%{query}%"
 
-        # Search in name
-        name_results = self.client.table('profiles').select('*').ilike('name', search_pattern).execute()
-
-        # Search in username
-        username_results = self.client.table('profiles').select('*').ilike('username', search_pattern).execute()
-
-        # Combine and deduplicate by profile_id
-        profiles_dict = {}
-        for profile in name_results.data + username_results.data:
-            profiles_dict[profile['profile_id']] = profile
+        # Quote the pattern so commas/parentheses in the query can't break the or= filter
+        quoted = '"' + search_pattern.replace('\\', '\\\\').replace('"', '\\"') + '"'
 
-        # Sort by name
-        profiles = sorted(profiles_dict.values(), key=lambda p: p['name'])
-        return profiles
+        # Search name and username in one request (backed by trigram indexes)
+        result = self.client.table('profiles').select('*').or_(
+            f"name.ilike.{quoted},username.ilike.{quoted}"
+        ).order('name').execute()
+        return result.data
@@ -2,8 +2,10 @@
 """
 Rename .bin files to proper extensions based on their MIME type.
 """
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import subprocess
 
 # Process both images and videos
 cache_dirs = [
@@ -12,52 +14,108 @@ cache_dirs = [
     Path("cache/media/documents"),
 ]
 
+# Map MIME type to extension
+ext_map = {
+    'image/jpeg': '.jpg',
+    'image/png': '.png',
+    'image/gif': '.gif',
+    'image/webp': '.webp',
+    'video/mp4': '.mp4',
+    'video/quicktime': '.mov',
+    'video/webm': '.webm',
+    'application/pdf': '.pdf',
+}
+
+# Sniffing and renaming is small-file I/O that releases the GIL
+MAX_WORKERS = 32
+
+# ISO base media major brands that `file` reports as video/mp4; other brands
+# (M4A audio, 3GP, M4V, HEIF images, ...) are left as .bin
+MP4_BRANDS = {
+    b'isom', b'iso2', b'iso3', b'iso4', b'iso5', b'iso6',
+    b'mp41', b'mp42', b'avc1', b'dash',
+}
+
+# EBML DocType element (ID 0x4282, 4-byte size) naming WebM; other EBML
+# files such as Matroska are left as .bin
+WEBM_DOCTYPE = b'\x42\x82\x84webm'
+
+
+def sniff_mime_type(path: Path) -> str:
+    """Detect a file's MIME type from its leading magic bytes.
+
+    Covers the types in ext_map, which is all the media cache stores, so no
+    `file` process has to be spawned per file.
+    """
+    with open(path, 'rb') as f:
+        head = f.read(64)
+
+    if head.startswith(b'\xff\xd8\xff'):
+        return 'image/jpeg'
+    if head.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'image/png'
+    if head.startswith((b'GIF87a', b'GIF89a')):
+        return 'image/gif'
+    if head.startswith(b'RIFF') and head[8:12] == b'WEBP':
+        return 'image/webp'
+    if head.startswith(b'%PDF'):
+        return 'application/pdf'
+    if head.startswith(b'\x1a\x45\xdf\xa3'):
+        # The DocType sits in the EBML header, within the first few bytes
+        if WEBM_DOCTYPE in head:
+            return 'video/webm'
+        return 'application/octet-stream'
+    if head[4:8] == b'ftyp':
+        brand = head[8:12]
+        if brand == b'qt  ':
+            return 'video/quicktime'
+        if brand in MP4_BRANDS:
+            return 'video/mp4'
+        return 'application/octet-stream'
+    if head[4:8] in (b'moov', b'mdat', b'wide', b'free'):
+        return 'video/quicktime'
+    return 'application/octet-stream'
+
+
+def rename_bin_file(bin_file: Path) -> Counter:
+    """Rename one .bin file to the extension matching its sniffed MIME type.
+
+    Returns a Counter of renamed files by MIME type (empty if left as .bin).
+    """
+    mime_type = sniff_mime_type(bin_file)
+    new_ext = ext_map.get(mime_type, '.bin')
+    if new_ext == '.bin':
+        return Counter()
+
+    bin_file.rename(bin_file.with_suffix(new_ext))
+    return Counter({mime_type: 1})
+
+
 total_renamed = 0
 
-for cache_dir in cache_dirs:
-    if not cache_dir.exists():
-        continue
-
-    # Get all .bin files
-    bin_files = list(cache_dir.glob("*.bin"))
-    if not bin_files:
-        continue
-
-    print(f"\n{cache_dir.name.upper()}:")
-    print(f"Found {len(bin_files)} .bin files")
-
-    renamed = 0
-    for bin_file in bin_files:
-        # Use 'file' command to detect type
-        result = subprocess.run(
-            ["file", "--mime-type", "-b", str(bin_file)],
-            capture_output=True,
-            text=True
-        )
-        mime_type = result.stdout.strip()
-
-        # Map MIME type to extension
-        ext_map = {
-            'image/jpeg': '.jpg',
-            'image/png': '.png',
-            'image/gif': '.gif',
-            'image/webp': '.webp',
-            'video/mp4': '.mp4',
-            'video/quicktime': '.mov',
-            'video/webm': '.webm',
-            'application/pdf': '.pdf',
-        }
-
-        new_ext = ext_map.get(mime_type, '.bin')
-
-        if new_ext != '.bin':
-            new_name = bin_file.with_suffix(new_ext)
-            bin_file.rename(new_name)
-            renamed += 1
-            if renamed <= 3:  # Show first 3 per directory
-                print(f"  ✓ {bin_file.name} → {new_name.name} ({mime_type})")
-
-    print(f"  Renamed {renamed} files")
-    total_renamed += renamed
+with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+    for cache_dir in cache_dirs:
+        if not cache_dir.exists():
+            continue
+
+        # Get all .bin files (scandir avoids a stat per entry)
+        with os.scandir(cache_dir) as entries:
+            bin_files = [Path(e.path) for e in entries if e.name.endswith('.bin')]
+        if not bin_files:
+            continue
+
+        print(f"\n{cache_dir.name.upper()}:")
+        print(f"Found {len(bin_files)} .bin files")
+
+        counts = Counter()
+        for bin_file, result in zip(bin_files, executor.map(rename_bin_file, bin_files)):
+            if result and sum(counts.values()) < 3:  # Show first 3 per directory
+                mime_type = next(iter(result))
+                print(f"  ✓ {bin_file.name} → {bin_file.with_suffix(ext_map[mime_type]).name} ({mime_type})")
+            counts += result
+
+        renamed = sum(counts.values())
+        print(f"  Renamed {renamed} files")
+        total_renamed += renamed
 
 print(f"\n✓ Total renamed: {total_renamed} files")
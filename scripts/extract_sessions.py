@@ -1,11 +1,22 @@
 import json
 
-def extract_posts(file_path):
-    with open(file_path, 'r') as f:
-        data = json.load(f)
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+def iter_matching_elements(file_path):
+    """Yield entries of 'matching_elements' without holding the whole export in memory when ijson is available."""
+    with open(file_path, 'rb') as f:
+        if HAS_IJSON:
+            yield from ijson.items(f, 'matching_elements.item')
+        else:
+            yield from json.loads(f.read()).get('matching_elements', [])
 
+def extract_posts(file_path):
     sessions_posts = []
-    for item in data.get('matching_elements', []):
+    for item in iter_matching_elements(file_path):
         if item.get('ame') == 'sessions':
             title = item.get('article', {}).get('title')
             if not title:
@@ -16,8 +16,11 @@ Usage:
 import argparse
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 # Add project root to path for imports
@@ -33,15 +36,34 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared client config: adaptive retries and kept-alive connections, with
+# enough pool slots for the setup calls issued concurrently below
+S3_CLIENT_CONFIG = Config(
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    tcp_keepalive=True,
+    max_pool_connections=32,
+)
+
+
+@lru_cache(maxsize=4)
+def get_session(profile_name: str):
+    """Create (once per profile) the boto3 session shared by all clients."""
+    return boto3.Session(profile_name=profile_name)
+
 
+@lru_cache(maxsize=4)
 def get_s3_client(profile_name: str, region: str = None):
-    """Create S3 client using specified AWS profile."""
+    """Create S3 client using specified AWS profile.
+
+    Cached per (profile, region) so the config files are parsed and the
+    connection pool is built once.
+    """
     try:
-        session = boto3.Session(profile_name=profile_name)
+        session = get_session(profile_name)
         if region:
-            return session.client('s3', region_name=region)
+            return session.client('s3', region_name=region, config=S3_CLIENT_CONFIG)
         else:
-            return session.client('s3')
+            return session.client('s3', config=S3_CLIENT_CONFIG)
     except Exception as e:
         logger.error(f"Failed to create S3 client: {e}")
         raise
@@ -165,14 +187,61 @@ def configure_bucket_lifecycle(s3_client, bucket_name: str) -> bool:
         return False
 
 
-def test_bucket_access(s3_client, bucket_name: str) -> bool:
+def simulate_write_access(profile_name: str, bucket_name: str):
+    """
+    Check write access with IAM policy simulation instead of touching objects.
+
+    The simulation only evaluates identity policies, not the bucket policy,
+    so only an "allowed" result is conclusive.
+
+    Returns:
+        True if the simulation allowed both actions, None otherwise (not
+        allowed by identity policies alone, or the simulation could not be
+        performed, e.g. the caller may not call iam:SimulatePrincipalPolicy)
+    """
+    try:
+        session = get_session(profile_name)
+        arn = session.client('sts').get_caller_identity()['Arn']
+
+        # Simulation needs the role ARN, not the assumed-role session ARN
+        if ':assumed-role/' in arn:
+            account = arn.split(':')[4]
+            role_name = arn.split(':assumed-role/', 1)[1].split('/')[0]
+            arn = f"arn:aws:iam::{account}:role/{role_name}"
+
+        response = session.client('iam').simulate_principal_policy(
+            PolicySourceArn=arn,
+            ActionNames=['s3:PutObject', 's3:DeleteObject'],
+            ResourceArns=[f'arn:aws:s3:::{bucket_name}/*']
+        )
+        if all(
+            result['EvalDecision'] == 'allowed'
+            for result in response['EvaluationResults']
+        ):
+            return True
+
+        # May still be granted by the bucket policy, which is not simulated
+        logger.debug("IAM policy simulation did not allow writes; probing the bucket")
+        return None
+
+    except Exception as e:
+        logger.debug(f"IAM policy simulation unavailable: {e}")
+        return None
+
+
+def test_bucket_access(s3_client, bucket_name: str, profile_name: str = AWS_PROFILE) -> bool:
     """Test write access to the bucket."""
+    logger.info(f"Testing write access to bucket '{bucket_name}'...")
+
+    # Prefer a policy simulation: no data-plane traffic or object versions
+    if simulate_write_access(profile_name, bucket_name):
+        logger.info(f"✓ Write access verified (IAM policy simulation)")
+        return True
+
     try:
         test_key = 'cache/_test_access.txt'
         test_content = b'Access test'
 
-        logger.info(f"Testing write access to bucket '{bucket_name}'...")
-
         # Upload test object
         s3_client.put_object(
             Bucket=bucket_name,
@@ -242,16 +311,20 @@ def main():
         if exists:
             logger.info(f"✓ Bucket '{BUCKET_NAME}' already exists")
 
-            # Get bucket region
-            bucket_region = get_bucket_region(s3_client, BUCKET_NAME)
+            # Look up the region and test access concurrently (independent round trips)
+            with ThreadPoolExecutor() as executor:
+                region_future = executor.submit(get_bucket_region, s3_client, BUCKET_NAME)
+                access_future = executor.submit(test_bucket_access, s3_client, BUCKET_NAME)
+                bucket_region = region_future.result()
+                has_access = access_future.result()
+
             if bucket_region:
                 logger.info(f"  Region: {bucket_region}")
 
                 if bucket_region != args.region:
                     logger.warning(f"  Note: Bucket is in '{bucket_region}', not '{args.region}'")
 
-            # Test access
-            if not test_bucket_access(s3_client, BUCKET_NAME):
+            if not has_access:
                 logger.error("Cannot write to bucket. Check IAM permissions.")
                 return 1
 
@@ -268,16 +341,20 @@ def main():
         if not create_bucket(s3_client, BUCKET_NAME, args.region):
             return 1
 
-        # Configure versioning
-        if args.enable_versioning:
-            configure_bucket_versioning(s3_client, BUCKET_NAME, enabled=True)
+        # Versioning, lifecycle and the access test are independent, so run them concurrently
+        with ThreadPoolExecutor() as executor:
+            # Configure versioning
+            if args.enable_versioning:
+                executor.submit(configure_bucket_versioning, s3_client, BUCKET_NAME, enabled=True)
+
+            # Configure lifecycle
+            if not args.skip_lifecycle:
+                executor.submit(configure_bucket_lifecycle, s3_client, BUCKET_NAME)
 
-        # Configure lifecycle
-        if not args.skip_lifecycle:
-            configure_bucket_lifecycle(s3_client, BUCKET_NAME)
+            # Test access
+            access_future = executor.submit(test_bucket_access, s3_client, BUCKET_NAME)
 
-        # Test access
-        if not test_bucket_access(s3_client, BUCKET_NAME):
+        if not access_future.result():
             logger.warning("Bucket created but write access test failed")
 
         print("\n" + "=" * 80)
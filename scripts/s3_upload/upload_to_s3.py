@@ -14,16 +14,24 @@ Usage:
     python upload_to_s3.py --dry-run          # Show what would be uploaded
     python upload_to_s3.py --batch-size 50    # Upload 50 files at a time
     python upload_to_s3.py --force            # Re-upload even if archive_url exists
+    python upload_to_s3.py --resume           # Skip files already in S3 from an interrupted run
 """
 
 import argparse
+import base64
 import logging
 import os
+import queue
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
 # Add project root to path for imports
@@ -44,29 +52,68 @@ AWS_PROFILE = 'ab-power-user'
 BUCKET_NAME = 'social-tui'
 CACHE_ROOT = Path('cache/media')
 
+# Cache file extension for each MIME type
+_MIME_TO_EXT = {
+    'image/jpeg': '.jpg',
+    'image/jpg': '.jpg',
+    'image/png': '.png',
+    'image/gif': '.gif',
+    'image/webp': '.webp',
+    'video/mp4': '.mp4',
+    'video/webm': '.webm',
+    'video/quicktime': '.mov',
+    'application/pdf': '.pdf',
+}
+
+# Uploads are latency-bound, so run several at once over one shared client
+UPLOAD_WORKERS = 16
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={'max_attempts': 5, 'mode': 'adaptive'}
+)
+
+# Large files (videos, PDFs) upload their parts in parallel; 4 parts per
+# file keeps UPLOAD_WORKERS x max_concurrency within the connection pool
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True
+)
+
 # S3 key format: cache/{YYYY}/{MM}/{filename}.{ext}
-def get_s3_key(local_path: Path, created_at: Optional[str] = None) -> str:
+def get_s3_key(
+    local_path: Path,
+    created_at: Optional[str] = None,
+    mtime: Optional[float] = None
+) -> str:
     """
     Generate S3 key with date-based partitioning.
 
     Args:
         local_path: Path to the local file
         created_at: ISO timestamp string (from post_media.created_at)
+        mtime: Optional file mtime already known to the caller
 
     Returns:
         S3 key in format: cache/{YYYY}/{MM}/{filename}.{ext}
     """
     filename = local_path.name
 
+    # Fast path: an ISO timestamp starts with YYYY-MM, so slice it directly
+    if (created_at and len(created_at) >= 7 and created_at[4] == '-'
+            and created_at[:4].isdigit() and created_at[5:7].isdigit()):
+        return f"cache/{created_at[:4]}/{created_at[5:7]}/{filename}"
+
     # Use created_at timestamp if available, otherwise use file mtime
+    dt = None
     if created_at:
         try:
             dt = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
         except Exception as e:
             logger.warning(f"Could not parse created_at '{created_at}': {e}, using file mtime")
-            dt = datetime.fromtimestamp(local_path.stat().st_mtime)
-    else:
-        dt = datetime.fromtimestamp(local_path.stat().st_mtime)
+    if dt is None:
+        dt = datetime.fromtimestamp(mtime if mtime is not None else local_path.stat().st_mtime)
 
     year = dt.strftime('%Y')
     month = dt.strftime('%m')
@@ -74,12 +121,17 @@ def get_s3_key(local_path: Path, created_at: Optional[str] = None) -> str:
     return f"cache/{year}/{month}/{filename}"
 
 
-def get_s3_client(profile_name: str = AWS_PROFILE):
+@lru_cache(maxsize=4)
+def get_s3_client(profile_name: str = AWS_PROFILE, max_pool_connections: int = 64):
     """
     Create S3 client using specified AWS profile.
 
+    Cached so the session and its connection pool are built once per process.
+
     Args:
         profile_name: AWS profile name to use
+        max_pool_connections: Connection pool size (at least the number of
+            threads sharing the client)
 
     Returns:
         boto3 S3 client
@@ -89,28 +141,51 @@ def get_s3_client(profile_name: str = AWS_PROFILE):
     """
     try:
         session = boto3.Session(profile_name=profile_name)
-        return session.client('s3')
+        return session.client('s3', config=S3_CLIENT_CONFIG.merge(
+            Config(max_pool_connections=max_pool_connections)
+        ))
     except Exception as e:
         logger.error(f"Failed to create S3 client with profile '{profile_name}': {e}")
         raise
 
 
+def _content_md5(md5_sum: Optional[str]) -> Optional[str]:
+    """Convert a hex MD5 digest to the base64 form of the Content-MD5 header."""
+    if not md5_sum:
+        return None
+    try:
+        digest = bytes.fromhex(md5_sum)
+    except ValueError:
+        return None
+    if len(digest) != 16:
+        return None
+    return base64.b64encode(digest).decode('ascii')
+
+
 def upload_file_to_s3(
     s3_client,
     local_path: Path,
     bucket: str,
     s3_key: str,
-    mime_type: Optional[str] = None
+    mime_type: Optional[str] = None,
+    md5_sum: Optional[str] = None,
+    file_size: Optional[int] = None
 ) -> bool:
     """
     Upload a file to S3.
 
+    Files below the multipart threshold with a known md5_sum are sent as a
+    single PUT carrying it as Content-MD5, so S3 verifies the body against
+    the checksum already stored in post_media.
+
     Args:
         s3_client: boto3 S3 client
         local_path: Path to local file
         bucket: S3 bucket name
         s3_key: S3 key (path) for the file
         mime_type: Optional MIME type for Content-Type header
+        md5_sum: Optional hex MD5 of the file (from post_media.md5_sum)
+        file_size: Optional file size already known to the caller
 
     Returns:
         True if upload successful, False otherwise
@@ -120,14 +195,30 @@ def upload_file_to_s3(
         if mime_type:
             extra_args['ContentType'] = mime_type
 
+        content_md5 = _content_md5(md5_sum)
+
         logger.debug(f"Uploading {local_path} to s3://{bucket}/{s3_key}")
-        s3_client.upload_file(
-            str(local_path),
-            bucket,
-            s3_key,
-            ExtraArgs=extra_args if extra_args else None
-        )
-        logger.info(f"✓ Uploaded to s3://{bucket}/{s3_key}")
+        if file_size is None:
+            file_size = os.path.getsize(local_path)
+
+        if content_md5 and file_size < TRANSFER_CONFIG.multipart_threshold:
+            with open(local_path, 'rb') as f:
+                s3_client.put_object(
+                    Bucket=bucket,
+                    Key=s3_key,
+                    Body=f,
+                    ContentMD5=content_md5,
+                    **extra_args
+                )
+        else:
+            s3_client.upload_file(
+                str(local_path),
+                bucket,
+                s3_key,
+                ExtraArgs=extra_args if extra_args else None,
+                Config=TRANSFER_CONFIG
+            )
+        logger.debug(f"✓ Uploaded to s3://{bucket}/{s3_key}")
         return True
 
     except FileNotFoundError:
@@ -141,6 +232,112 @@ def upload_file_to_s3(
         return False
 
 
+# PostgREST returns at most this many rows per request (max_rows)
+PAGE_SIZE = 1000
+
+
+def paginate(make_query: Callable, limit: Optional[int] = None, page_size: int = PAGE_SIZE) -> Iterator[Dict]:
+    """
+    Yield all rows of an ordered Supabase query, one ranged request per page.
+
+    range() adds its offset/limit to the builder it is called on, so each
+    page is requested from a freshly built query.
+
+    Args:
+        make_query: Function returning the Supabase query builder, with a
+            deterministic order applied
+        limit: Optional maximum number of rows to yield
+        page_size: Rows requested per page
+
+    Yields:
+        Row dictionaries
+    """
+    offset = 0
+    while limit is None or offset < limit:
+        end = offset + page_size
+        if limit is not None:
+            end = min(end, limit)
+
+        page = make_query().range(offset, end - 1).execute().data
+        yield from page
+
+        if len(page) < end - offset:
+            break
+        offset = end
+
+
+MEDIA_COLUMNS = (
+    'media_id, media_type, local_file_path, file_extension, mime_type, '
+    'archive_url, created_at, md5_sum'
+)
+
+
+def _after_filter(record: Dict) -> str:
+    """
+    Build an or= filter selecting rows after record in (created_at, media_id) order.
+
+    Ascending order puts NULL created_at last, so those rows always follow
+    a dated record and are paged among themselves by media_id.
+    """
+    media_id = f'"{record["media_id"]}"'
+    created_at = record.get('created_at')
+    if created_at is None:
+        return f"and(created_at.is.null,media_id.gt.{media_id})"
+
+    created_at = f'"{created_at}"'
+    return (
+        f"created_at.gt.{created_at},"
+        f"and(created_at.eq.{created_at},media_id.gt.{media_id}),"
+        f"created_at.is.null"
+    )
+
+
+def iter_media_to_upload(
+    client,
+    limit: Optional[int] = None,
+    force: bool = False,
+    page_size: int = PAGE_SIZE
+) -> Iterator[Dict]:
+    """
+    Yield media records that need to be uploaded to S3, oldest first.
+
+    Pages by keyset (after the last seen created_at, media_id) rather than by
+    offset, so archive_url updates made while iterating don't shift later
+    pages and skip records.
+
+    Args:
+        client: Supabase client
+        limit: Optional limit on number of records to yield
+        force: If True, include records that already have archive_url
+        page_size: Records requested per page
+
+    Yields:
+        Media record dictionaries
+    """
+    last = None
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = page_size if remaining is None else min(page_size, remaining)
+
+        query = client.table('post_media').select(MEDIA_COLUMNS)
+
+        # Filter by archive_url unless force is True
+        if not force:
+            query = query.is_('archive_url', 'null')
+        if last is not None:
+            query = query.or_(_after_filter(last))
+
+        # Order by created_at (oldest first for backfill), media_id breaks ties
+        page = query.order('created_at', desc=False).order('media_id').limit(size).execute().data
+        yield from page
+
+        if len(page) < size:
+            break
+        last = page[-1]
+        if remaining is not None:
+            remaining -= len(page)
+
+
 def get_media_to_upload(
     client,
     limit: Optional[int] = None,
@@ -159,27 +356,88 @@ def get_media_to_upload(
     """
     logger.info("Querying post_media for files to upload...")
 
-    # Build query
-    query = client.table('post_media').select(
-        'media_id, media_type, local_file_path, mime_type, archive_url, created_at, md5_sum'
-    )
+    media_records = list(iter_media_to_upload(client, limit=limit, force=force))
+
+    logger.info(f"Found {len(media_records)} media records to process")
+    return media_records
 
-    # Filter by archive_url unless force is True
-    if not force:
-        query = query.is_('archive_url', 'null')
 
-    # Order by created_at (oldest first for backfill)
-    query = query.order('created_at', desc=False)
+# Records buffered between the fetching thread and the uploaders
+PREFETCH_QUEUE_SIZE = 200
+_END_OF_RECORDS = object()
 
-    # Add limit if specified
-    if limit:
-        query = query.limit(limit)
 
-    result = query.execute()
-    media_records = result.data
+def _prefetch_records(records: Iterator[Dict], maxsize: int = PREFETCH_QUEUE_SIZE) -> Iterator[Dict]:
+    """
+    Iterate records fetched on a background thread through a bounded queue.
 
-    logger.info(f"Found {len(media_records)} media records to process")
-    return media_records
+    Lets uploads start on the first page while later pages are still being
+    fetched. Errors raised while fetching are re-raised to the consumer.
+    """
+    record_queue = queue.Queue(maxsize=maxsize)
+    errors = []
+
+    def produce():
+        try:
+            for record in records:
+                record_queue.put(record)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            record_queue.put(_END_OF_RECORDS)
+
+    threading.Thread(target=produce, name='media-prefetch', daemon=True).start()
+
+    while True:
+        record = record_queue.get()
+        if record is _END_OF_RECORDS:
+            break
+        yield record
+
+    if errors:
+        raise errors[0]
+
+
+def _batches(records: Iterator[Dict], batch_size: int) -> Iterator[List[Dict]]:
+    """Group an iterator of records into lists of up to batch_size."""
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+@lru_cache(maxsize=None)
+def _dir_listing(directory: Path) -> frozenset:
+    """
+    Names of the files in a directory.
+
+    Read once per directory per process with os.scandir, so existence checks
+    for every record become set lookups instead of stat() calls.
+    """
+    if not directory.is_dir():
+        return frozenset()
+    with os.scandir(directory) as entries:
+        return frozenset(entry.name for entry in entries if entry.is_file())
+
+
+@lru_cache(maxsize=None)
+def _index_media_dir(media_type: str) -> Dict[str, Path]:
+    """
+    Index a media type's cache directory by md5 (the filename before the first dot).
+
+    Built once per process so lookups don't glob the directory per record.
+    """
+    media_dir = CACHE_ROOT / f"{media_type}s"
+    index = {}
+    for name in _dir_listing(media_dir):
+        stem, dot, _ = name.partition('.')
+        if dot:
+            index.setdefault(stem, media_dir / name)
+    return index
 
 
 def verify_local_file(media_record: Dict) -> Optional[Path]:
@@ -187,9 +445,10 @@ def verify_local_file(media_record: Dict) -> Optional[Path]:
     Verify that the local file exists for a media record.
 
     Tries multiple strategies to find the file:
-    1. Use local_file_path from database if it exists
-    2. Use md5_sum + extension derived from mime_type
-    3. Search for md5_sum with any extension in the appropriate media type directory
+    1. Use md5_sum + file_extension recorded at ingest
+    2. Use local_file_path from database if it exists
+    3. Use md5_sum + extension derived from mime_type
+    4. Search for md5_sum with any extension in the appropriate media type directory
 
     Args:
         media_record: Media record from database
@@ -203,43 +462,39 @@ def verify_local_file(media_record: Dict) -> Optional[Path]:
     mime_type = media_record.get('mime_type')
     media_type = media_record.get('media_type', 'image')
 
-    # Strategy 1: Try the path from database
+    file_extension = media_record.get('file_extension')
+    media_dir = CACHE_ROOT / f"{media_type}s"  # images, videos, documents
+
+    # Strategy 1: Path is fully determined by md5_sum + the recorded extension
+    if md5_sum and file_extension:
+        filename = f"{md5_sum}.{file_extension}"
+        if filename in _dir_listing(media_dir):
+            return media_dir / filename
+
+    # Strategy 2: Try the path from database
     if local_path_str:
         local_path = Path(local_path_str)
-        if local_path.exists():
+        if local_path.name in _dir_listing(local_path.parent):
             return local_path
 
-    # Strategy 2: Use md5_sum + extension from mime_type
+    # Strategy 3: Use md5_sum + extension from mime_type
     if md5_sum and mime_type:
         # Get extension from MIME type
-        mime_to_ext = {
-            'image/jpeg': '.jpg',
-            'image/jpg': '.jpg',
-            'image/png': '.png',
-            'image/gif': '.gif',
-            'image/webp': '.webp',
-            'video/mp4': '.mp4',
-            'video/webm': '.webm',
-            'video/quicktime': '.mov',
-            'application/pdf': '.pdf',
-        }
-        ext = mime_to_ext.get(mime_type.lower(), '.bin')
+        ext = _MIME_TO_EXT.get(mime_type.lower(), '.bin')
 
         # Construct path based on media type
-        media_dir = CACHE_ROOT / f"{media_type}s"  # images, videos, documents
         expected_path = media_dir / f"{md5_sum}{ext}"
 
-        if expected_path.exists():
+        if expected_path.name in _dir_listing(media_dir):
             logger.debug(f"Found file using md5_sum: {expected_path}")
             return expected_path
 
-    # Strategy 3: Search for any file with matching md5_sum in the media type directory
+    # Strategy 4: Search for any file with matching md5_sum in the media type directory
     if md5_sum:
-        media_dir = CACHE_ROOT / f"{media_type}s"
-        if media_dir.exists():
-            for file_path in media_dir.glob(f"{md5_sum}.*"):
-                logger.debug(f"Found file by glob search: {file_path}")
-                return file_path
+        file_path = _index_media_dir(media_type).get(md5_sum)
+        if file_path:
+            logger.debug(f"Found file by directory index: {file_path}")
+            return file_path
 
     logger.warning(f"Media {media_id} not found (md5: {md5_sum}, path: {local_path_str})")
     return None
@@ -270,11 +525,120 @@ def update_archive_url(client, media_id: str, s3_url: str) -> bool:
         return False
 
 
+def update_archive_urls(client, updates: List[Dict]) -> Dict[str, bool]:
+    """
+    Update archive_url for many post_media rows in one request.
+
+    Uses the set_archive_urls RPC (an UPDATE ... FROM over the given rows);
+    a partial upsert would trip the table's NOT NULL columns. If the RPC
+    fails, falls back to per-row updates so failures are attributed.
+
+    Args:
+        client: Supabase client
+        updates: List of {'media_id': ..., 'archive_url': ...} dictionaries
+
+    Returns:
+        Dictionary mapping media_id to whether its update succeeded
+    """
+    if not updates:
+        return {}
+
+    try:
+        result = client.rpc('set_archive_urls', {'updates': updates}).execute()
+        updated = set(result.data or [])
+        logger.debug(f"Updated archive_url for {len(updated)} media records")
+        return {u['media_id']: u['media_id'] in updated for u in updates}
+
+    except Exception as e:
+        logger.warning(f"Batch archive_url update failed ({e}), retrying per record")
+        return {
+            u['media_id']: update_archive_url(client, u['media_id'], u['archive_url'])
+            for u in updates
+        }
+
+
+def s3_object_exists(s3_client, bucket: str, s3_key: str) -> bool:
+    """
+    Check whether an object is already stored at the given key.
+
+    Errors other than a 404 are logged and treated as "not there", so the
+    caller uploads as usual.
+    """
+    try:
+        s3_client.head_object(Bucket=bucket, Key=s3_key)
+        return True
+    except ClientError as e:
+        if e.response['Error']['Code'] != '404':
+            logger.warning(f"Could not check s3://{bucket}/{s3_key}: {e}")
+        return False
+
+
+def _upload_one(s3_client, record: Dict, resume: bool = False) -> Dict:
+    """
+    Upload one media record's file to S3.
+
+    Runs on a worker thread; the caller aggregates stats from the result
+    and writes archive_url for the whole batch.
+
+    Args:
+        s3_client: boto3 S3 client
+        record: Media record from database
+        resume: If True, skip the upload when the object already exists
+
+    Returns:
+        Dictionary with media_id, status ('missing', 'exists', 'upload_failed'
+        or 'uploaded'), local_path, s3_key and s3_url
+    """
+    result = {'media_id': record['media_id'], 'local_path': None, 's3_key': None, 's3_url': None}
+
+    # Verify local file exists
+    local_path = verify_local_file(record)
+    if not local_path:
+        result['status'] = 'missing'
+        return result
+    result['local_path'] = local_path
+
+    # One stat serves both the key's mtime fallback and the upload size check
+    try:
+        file_stat = local_path.stat()
+    except FileNotFoundError:
+        result['status'] = 'missing'
+        return result
+
+    # Generate S3 key and URL
+    s3_key = get_s3_key(local_path, record.get('created_at'), mtime=file_stat.st_mtime)
+    s3_url = f"s3://{BUCKET_NAME}/{s3_key}"
+    result['s3_key'] = s3_key
+    result['s3_url'] = s3_url
+
+    # Already uploaded by an earlier, interrupted run: only archive_url is missing
+    if resume and s3_object_exists(s3_client, BUCKET_NAME, s3_key):
+        result['status'] = 'exists'
+        return result
+
+    # Upload to S3
+    if not upload_file_to_s3(
+        s3_client,
+        local_path,
+        BUCKET_NAME,
+        s3_key,
+        record.get('mime_type'),
+        record.get('md5_sum'),
+        file_stat.st_size
+    ):
+        result['status'] = 'upload_failed'
+        return result
+
+    result['status'] = 'uploaded'
+    return result
+
+
 def upload_media_to_s3(
     dry_run: bool = False,
     limit: Optional[int] = None,
     batch_size: int = 50,
-    force: bool = False
+    force: bool = False,
+    resume: bool = False
 ) -> Dict:
     """
     Main function to upload media files to S3.
@@ -284,6 +648,7 @@ def upload_media_to_s3(
         limit: Optional limit on number of files to upload
         batch_size: Number of files to process in each batch
         force: If True, re-upload even if archive_url exists
+        resume: If True, don't re-upload files already present in S3
 
     Returns:
         Dictionary with upload statistics
@@ -293,6 +658,7 @@ def upload_media_to_s3(
         'files_found': 0,
         'files_missing': 0,
         'uploads_attempted': 0,
+        'uploads_skipped': 0,
         'uploads_successful': 0,
         'uploads_failed': 0,
         'db_updates_successful': 0,
@@ -312,15 +678,15 @@ def upload_media_to_s3(
             logger.error(f"Failed to initialize S3 client: {e}")
             return stats
 
-    # Get media records to upload
-    media_records = get_media_to_upload(client, limit=limit, force=force)
-    stats['total_media'] = len(media_records)
+    if dry_run:
+        # Get media records to upload
+        media_records = get_media_to_upload(client, limit=limit, force=force)
+        stats['total_media'] = len(media_records)
 
-    if not media_records:
-        logger.info("No media files need uploading")
-        return stats
+        if not media_records:
+            logger.info("No media files need uploading")
+            return stats
 
-    if dry_run:
         print("\n" + "=" * 80)
         print("DRY RUN - No files will be uploaded or database updated")
         print("=" * 80)
@@ -345,59 +711,74 @@ def upload_media_to_s3(
 
         return stats
 
-    # Process media files in batches
+    # Process media files in batches, fetching later pages while uploading
     print("\n" + "=" * 80)
     print("Uploading Media to S3")
     print("=" * 80)
     print(f"Bucket:  s3://{BUCKET_NAME}")
     print(f"Profile: {AWS_PROFILE}")
-    print(f"Files:   {len(media_records)}")
     print()
 
-    for i in range(0, len(media_records), batch_size):
-        batch = media_records[i:i + batch_size]
-        batch_num = (i // batch_size) + 1
-        total_batches = (len(media_records) + batch_size - 1) // batch_size
+    logger.info("Querying post_media for files to upload...")
+    records = _prefetch_records(iter_media_to_upload(client, limit=limit, force=force))
 
-        print(f"\nBatch {batch_num}/{total_batches} ({len(batch)} files)")
-        print("-" * 80)
+    with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as executor:
+        for batch_num, batch in enumerate(_batches(records, batch_size), 1):
+            stats['total_media'] += len(batch)
 
-        for record in batch:
-            media_id = record['media_id']
+            # Collect the batch's report and write it once, not per file
+            lines = [f"\nBatch {batch_num} ({len(batch)} files)", "-" * 80]
+
+            futures = [
+                executor.submit(_upload_one, s3_client, record, resume)
+                for record in batch
+            ]
+
+            uploaded = []
+            for future in as_completed(futures):
+                result = future.result()
+                status = result['status']
+
+                if status == 'missing':
+                    stats['files_missing'] += 1
+                    lines.append(f"  ✗ {result['media_id']}: Local file not found")
+                    continue
+
+                stats['files_found'] += 1
+
+                if status == 'exists':
+                    stats['uploads_skipped'] += 1
+                    uploaded.append(result)
+                    continue
+
+                stats['uploads_attempted'] += 1
+
+                if status == 'upload_failed':
+                    stats['uploads_failed'] += 1
+                    continue
 
-            # Verify local file exists
-            local_path = verify_local_file(record)
-            if not local_path:
-                stats['files_missing'] += 1
-                print(f"  ✗ {media_id}: Local file not found")
-                continue
-
-            stats['files_found'] += 1
-
-            # Generate S3 key and URL
-            s3_key = get_s3_key(local_path, record.get('created_at'))
-            s3_url = f"s3://{BUCKET_NAME}/{s3_key}"
-
-            # Upload to S3
-            stats['uploads_attempted'] += 1
-            if upload_file_to_s3(
-                s3_client,
-                local_path,
-                BUCKET_NAME,
-                s3_key,
-                record.get('mime_type')
-            ):
                 stats['uploads_successful'] += 1
+                uploaded.append(result)
 
-                # Update database with archive_url
-                if update_archive_url(client, media_id, s3_url):
+            # Update database with archive_url for the whole batch
+            db_results = update_archive_urls(client, [
+                {'media_id': result['media_id'], 'archive_url': result['s3_url']}
+                for result in uploaded
+            ])
+
+            for result in uploaded:
+                media_id = result['media_id']
+                if db_results.get(media_id):
                     stats['db_updates_successful'] += 1
-                    print(f"  ✓ {media_id}: {local_path.name} → {s3_key}")
+                    lines.append(f"  ✓ {media_id}: {result['local_path'].name} → {result['s3_key']}")
                 else:
                     stats['db_updates_failed'] += 1
-                    print(f"  ⚠ {media_id}: Uploaded but DB update failed")
-            else:
-                stats['uploads_failed'] += 1
+                    lines.append(f"  ⚠ {media_id}: Uploaded but DB update failed")
+
+            print("\n".join(lines), flush=True)
+
+    if not stats['total_media']:
+        logger.info("No media files need uploading")
 
     return stats
 
@@ -414,6 +795,7 @@ Examples:
   python upload_to_s3.py --dry-run          # Show what would be uploaded
   python upload_to_s3.py --batch-size 50    # Upload 50 files at a time
   python upload_to_s3.py --force            # Re-upload even if already archived
+  python upload_to_s3.py --resume           # Skip files already in S3 from an interrupted run
 
 AWS Configuration:
   Profile: {profile}
@@ -443,6 +825,11 @@ AWS Configuration:
         action='store_true',
         help='Re-upload files even if archive_url already exists'
     )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Check S3 first and only record archive_url for files already uploaded'
+    )
 
     args = parser.parse_args()
 
@@ -451,7 +838,8 @@ AWS Configuration:
             dry_run=args.dry_run,
             limit=args.limit,
             batch_size=args.batch_size,
-            force=args.force
+            force=args.force,
+            resume=args.resume
         )
 
         # Print summary
@@ -463,6 +851,7 @@ AWS Configuration:
         print(f"Local Files Missing:  {stats['files_missing']}")
         print(f"\nUploads:")
         print(f"  Attempted:          {stats['uploads_attempted']}")
+        print(f"  Already in S3:      {stats['uploads_skipped']}")
         print(f"  Successful:         {stats['uploads_successful']}")
         print(f"  Failed:             {stats['uploads_failed']}")
         print(f"\nDatabase Updates:")
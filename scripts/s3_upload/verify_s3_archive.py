@@ -16,9 +16,9 @@ Usage:
 import argparse
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict
-import boto3
+from typing import Dict, Optional, Set, Tuple
 from botocore.exceptions import ClientError
 
 # Add project root to path for imports
@@ -26,7 +26,9 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from supabase_client import get_supabase_client
-from scripts.s3_upload.upload_to_s3 import AWS_PROFILE, BUCKET_NAME, verify_local_file
+from scripts.s3_upload.upload_to_s3 import (
+    AWS_PROFILE, BUCKET_NAME, get_s3_client, paginate, verify_local_file
+)
 
 # Setup logging
 logging.basicConfig(
@@ -36,16 +38,64 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# head_object checks are latency-bound; run them concurrently on one client
+VERIFY_WORKERS = 32
+
+# Media types reported in the per-type breakdown
+MEDIA_TYPES = ['image', 'video', 'document']
+
+
 def get_archive_stats(client) -> Dict:
     """
     Get statistics about archived vs unarchived media.
 
+    Uses the archive_stats RPC (one grouped query); falls back to
+    individual count queries if the function is not installed.
+
     Args:
         client: Supabase client
 
     Returns:
         Dictionary with statistics
     """
+    try:
+        rows = client.rpc('archive_stats').execute().data
+    except Exception as e:
+        logger.warning(f"archive_stats RPC unavailable ({e}), using count queries")
+        return _get_archive_stats_by_count(client)
+
+    stats = {
+        'total': 0,
+        'archived': 0,
+        'not_archived': 0,
+        'by_type': {
+            media_type: {'total': 0, 'archived': 0, 'not_archived': 0}
+            for media_type in MEDIA_TYPES
+        }
+    }
+
+    for row in rows:
+        total = row['total']
+        archived = row['archived']
+
+        # The rollup row (is_total) holds the overall totals; a NULL
+        # media_type alone may also be a group of untyped media
+        if row.get('is_total', row['media_type'] is None):
+            stats['total'] = total
+            stats['archived'] = archived
+            stats['not_archived'] = total - archived
+        elif row['media_type'] in stats['by_type']:
+            stats['by_type'][row['media_type']] = {
+                'total': total,
+                'archived': archived,
+                'not_archived': total - archived
+            }
+
+    return stats
+
+
+def _get_archive_stats_by_count(client) -> Dict:
+    """Compute get_archive_stats' result with one count query per figure."""
     stats = {
         'total': 0,
         'archived': 0,
@@ -54,12 +104,12 @@ def get_archive_stats(client) -> Dict:
     }
 
     # Get total count
-    result = client.table('post_media').select('media_id', count='exact').execute()
+    result = client.table('post_media').select('media_id', count='exact', head=True).execute()
     stats['total'] = result.count
 
     # Get archived count
     result = client.table('post_media').select(
-        'media_id', count='exact'
+        'media_id', count='exact', head=True
     ).not_.is_('archive_url', 'null').execute()
     stats['archived'] = result.count
 
@@ -67,16 +117,16 @@ def get_archive_stats(client) -> Dict:
     stats['not_archived'] = stats['total'] - stats['archived']
 
     # Get counts by media type
-    for media_type in ['image', 'video', 'document']:
+    for media_type in MEDIA_TYPES:
         # Total for type
         result = client.table('post_media').select(
-            'media_id', count='exact'
+            'media_id', count='exact', head=True
         ).eq('media_type', media_type).execute()
         total = result.count
 
         # Archived for type
         result = client.table('post_media').select(
-            'media_id', count='exact'
+            'media_id', count='exact', head=True
         ).eq('media_type', media_type).not_.is_('archive_url', 'null').execute()
         archived = result.count
 
@@ -89,13 +139,94 @@ def get_archive_stats(client) -> Dict:
     return stats
 
 
-def verify_s3_files(client, limit: int = None) -> Dict:
+def _parse_s3_url(archive_url: str) -> Optional[Tuple[str, str]]:
+    """
+    Split an s3://bucket/key archive URL.
+
+    Returns:
+        Tuple of (bucket, key), or None if the URL is malformed
+    """
+    # Parse S3 URL: s3://bucket/key
+    if not archive_url.startswith('s3://'):
+        logger.warning(f"Invalid S3 URL: {archive_url}")
+        return None
+
+    # Extract bucket and key
+    parts = archive_url[5:].split('/', 1)
+    if len(parts) != 2:
+        logger.warning(f"Invalid S3 URL format: {archive_url}")
+        return None
+
+    return parts[0], parts[1]
+
+
+def _head_one(s3_client, bucket: str, key: str) -> str:
+    """
+    Check that a single object exists.
+
+    Returns:
+        'exists', 'missing' or 'error'
+    """
+    try:
+        s3_client.head_object(Bucket=bucket, Key=key)
+        return 'exists'
+    except ClientError as e:
+        if e.response['Error']['Code'] == '404':
+            return 'missing'
+        logger.error(f"Error checking {key}: {e}")
+        return 'error'
+
+
+def _list_prefix(s3_client, bucket: str, prefix: str) -> Set[str]:
+    """List every key under a prefix (1000 keys per request)."""
+    keys = set()
+    paginator = s3_client.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        keys.update(obj['Key'] for obj in page.get('Contents', []))
+    return keys
+
+
+def _list_archive_keys(s3_client, locations, workers: int) -> Optional[Set[Tuple[str, str]]]:
+    """
+    List the cache/YYYY/MM/ prefixes the given objects live under.
+
+    Args:
+        s3_client: boto3 S3 client
+        locations: Iterable of (bucket, key) tuples
+        workers: Number of prefixes listed concurrently
+
+    Returns:
+        Set of existing (bucket, key) tuples, or None if listing isn't permitted
+    """
+    prefixes = sorted({(bucket, key[:key.rfind('/') + 1]) for bucket, key in locations})
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            listings = executor.map(
+                lambda bucket_prefix: _list_prefix(s3_client, *bucket_prefix), prefixes
+            )
+            existing = set()
+            for (bucket, _), keys in zip(prefixes, listings):
+                existing.update((bucket, key) for key in keys)
+    except ClientError as e:
+        logger.warning(f"Could not list archive prefixes ({e}), checking objects individually")
+        return None
+
+    print(f"  Listed {len(prefixes)} prefixes ({len(existing):,} objects)")
+    return existing
+
+
+def verify_s3_files(client, limit: int = None, workers: int = VERIFY_WORKERS) -> Dict:
     """
     Verify that S3 files actually exist for archived media.
 
+    Lists each month prefix the archive uses and compares against the DB;
+    if listing is not permitted, falls back to one head_object per file.
+
     Args:
         client: Supabase client
         limit: Optional limit on number of files to check
+        workers: Number of S3 requests kept in flight
 
     Returns:
         Dictionary with verification results
@@ -110,58 +241,51 @@ def verify_s3_files(client, limit: int = None) -> Dict:
 
     # Get S3 client
     try:
-        session = boto3.Session(profile_name=AWS_PROFILE)
-        s3_client = session.client('s3')
+        # One pooled connection per in-flight request
+        s3_client = get_s3_client(AWS_PROFILE, max_pool_connections=max(workers, 10))
     except Exception as e:
         logger.error(f"Failed to create S3 client: {e}")
         return results
 
     # Get archived media records
-    query = client.table('post_media').select(
-        'media_id, archive_url'
-    ).not_.is_('archive_url', 'null')
-
-    if limit:
-        query = query.limit(limit)
+    def query():
+        return client.table('post_media').select(
+            'media_id, archive_url'
+        ).not_.is_('archive_url', 'null').order('media_id')
 
-    media_records = query.execute().data
+    media_records = list(paginate(query, limit=limit))
 
     print(f"\nVerifying {len(media_records)} S3 files...")
     print("-" * 80)
 
-    for record in media_records:
-        results['checked'] += 1
-        archive_url = record['archive_url']
-
-        # Parse S3 URL: s3://bucket/key
-        if not archive_url.startswith('s3://'):
-            logger.warning(f"Invalid S3 URL: {archive_url}")
-            results['errors'] += 1
-            continue
-
-        # Extract bucket and key
-        parts = archive_url[5:].split('/', 1)
-        if len(parts) != 2:
-            logger.warning(f"Invalid S3 URL format: {archive_url}")
-            results['errors'] += 1
-            continue
-
-        bucket, key = parts
-
-        # Check if object exists
-        try:
-            s3_client.head_object(Bucket=bucket, Key=key)
-            results['exists'] += 1
-            if results['checked'] % 10 == 0:
-                print(f"  ✓ Checked {results['checked']} files...")
-        except ClientError as e:
-            if e.response['Error']['Code'] == '404':
+    archive_urls = [record['archive_url'] for record in media_records]
+    locations = {url: _parse_s3_url(url) for url in archive_urls}
+    existing = _list_archive_keys(
+        s3_client, [loc for loc in locations.values() if loc], workers
+    )
+
+    def check(archive_url: str) -> str:
+        location = locations[archive_url]
+        if location is None:
+            return 'error'
+        if existing is not None:
+            return 'exists' if location in existing else 'missing'
+        return _head_one(s3_client, *location)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for archive_url, status in zip(archive_urls, executor.map(check, archive_urls)):
+            results['checked'] += 1
+
+            if status == 'exists':
+                results['exists'] += 1
+                if existing is None and results['checked'] % 10 == 0:
+                    print(f"  ✓ Checked {results['checked']} files...")
+            elif status == 'missing':
                 results['missing'] += 1
                 results['missing_urls'].append(archive_url)
-                print(f"  ✗ Missing: {key}")
+                print(f"  ✗ Missing: {locations[archive_url][1]}")
             else:
                 results['errors'] += 1
-                logger.error(f"Error checking {key}: {e}")
 
     return results
 
@@ -185,14 +309,12 @@ def check_local_files(client, limit: int = None) -> Dict:
     }
 
     # Get all media records
-    query = client.table('post_media').select(
-        'media_id, media_type, local_file_path, mime_type, md5_sum'
-    )
-
-    if limit:
-        query = query.limit(limit)
+    def query():
+        return client.table('post_media').select(
+            'media_id, media_type, local_file_path, file_extension, mime_type, md5_sum'
+        ).order('media_id')
 
-    media_records = query.execute().data
+    media_records = list(paginate(query, limit=limit))
 
     print(f"\nChecking {len(media_records)} local files...")
     print("-" * 80)
@@ -238,6 +360,12 @@ def main():
         type=int,
         help='Limit number of files to check (for --verify-s3 and --check-local)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=VERIFY_WORKERS,
+        help=f'Concurrent S3 requests for --verify-s3 (default: {VERIFY_WORKERS})'
+    )
 
     args = parser.parse_args()
 
@@ -270,7 +398,7 @@ def main():
         print("S3 File Verification")
         print("=" * 80)
 
-        verify_results = verify_s3_files(client, limit=args.limit)
+        verify_results = verify_s3_files(client, limit=args.limit, workers=args.workers)
 
         print(f"\nResults:")
         print(f"  Checked:           {verify_results['checked']:,}")
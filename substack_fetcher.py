@@ -1,14 +1,25 @@
 """Substack data fetcher for social-tui."""
 
 import feedparser
+import gzip
 import json
 import logging
+import ssl
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
-from time import mktime
-from typing import List, Dict, Any, Optional
+from time import mktime, struct_time
+from typing import List, Dict, Any, Optional, Set, Tuple
+from urllib.error import HTTPError
+from urllib.request import HTTPSHandler, Request, build_opener
 
 from supabase_client import get_supabase_client
-from db_utils import generate_aws_id, PREFIX_POST
+from db_utils import generate_aws_ids, PREFIX_POST
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # Configure logging
 logging.basicConfig(
@@ -17,6 +28,54 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Feeds are fetched concurrently; each request gives up after FEED_TIMEOUT seconds
+FEED_WORKERS = 8
+FEED_TIMEOUT = 15
+
+# One TLS context and opener for every fetch, so the CA bundle is loaded once
+# per process rather than once per feed
+_SSL_CONTEXT = ssl.create_default_context()
+_FEED_OPENER = build_opener(HTTPSHandler(context=_SSL_CONTEXT))
+
+# feedparser's *_detail fields repeat the plain value with type/language metadata
+REDUNDANT_ENTRY_KEYS = ('title_detail', 'summary_detail')
+
+
+def entry_timestamp(entry: Dict[str, Any]) -> Optional[int]:
+    """Return an entry's publish time as a Unix timestamp, or None if absent."""
+    published_struct = entry.get('published_parsed')
+    if published_struct:
+        return int(mktime(published_struct))
+    return None
+
+
+def entry_to_json(entry: Dict[str, Any]) -> str:
+    """Serialize a feed entry for the raw_json column.
+
+    Redundant fields are dropped (including content that only repeats the
+    summary), parsed timestamps become lists as the stdlib encoder would
+    write them, and orjson is used when it is installed.
+    """
+    data = {}
+    for key, value in entry.items():
+        if key in REDUNDANT_ENTRY_KEYS:
+            continue
+        if isinstance(value, struct_time):
+            value = list(value)
+        data[key] = value
+
+    summary = data.get('summary')
+    content = data.get('content')
+    if content and all(part.get('value') == summary for part in content):
+        del data['content']
+
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(data).decode()
+        except TypeError:
+            pass
+    return json.dumps(data, separators=(',', ':'))
+
 
 class SubstackFetcher:
     """Fetcher for Substack RSS feeds."""
@@ -38,19 +97,73 @@ class SubstackFetcher:
             .execute()
         return response.data
 
-    def fetch_feed(self, username: str) -> Optional[feedparser.FeedParserDict]:
+    def get_feed_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load the stored validators and publish watermark for every feed.
+
+        Returns:
+            Dictionary mapping username to its feed_cache row; empty if the
+            feed_cache table is unavailable (feeds are then fetched in full).
+        """
+        try:
+            response = self.client.table('feed_cache') \
+                .select('username, etag, last_modified, last_posted_at_timestamp') \
+                .execute()
+        except Exception as e:
+            logger.warning(f"Feed cache unavailable, fetching all feeds in full: {e}")
+            return {}
+        return {row['username']: row for row in response.data}
+
+    def save_feed_cache(self, rows: List[Dict[str, Any]]):
+        """Store the validators and watermark of feeds whose posts were saved.
+
+        Args:
+            rows: Complete feed_cache rows (every column set, as one bulk
+                upsert writes the same columns for all rows)
+        """
+        if not rows:
+            return
+        try:
+            self.client.table('feed_cache').upsert(rows, on_conflict='username', returning='minimal').execute()
+        except Exception as e:
+            logger.warning(f"Could not update feed cache: {e}")
+
+    def fetch_feed(self, username: str, cached: Optional[Dict[str, Any]] = None) -> Optional[feedparser.FeedParserDict]:
         """Fetch and parse RSS feed for a Substack username.
 
         Args:
             username: Substack subdomain (e.g. 'trilogyai')
+            cached: Optional feed_cache row; its validators make the request
+                conditional
 
         Returns:
-            Parsed feed object or None if failed.
+            Parsed feed object (with 'status', 'etag' and 'modified' set),
+            an empty feed with status 304 if unchanged, or None if failed.
         """
         url = f"https://{username}.substack.com/feed"
+        headers = {'User-Agent': feedparser.USER_AGENT, 'Accept-Encoding': 'gzip'}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
         try:
             logger.info(f"Fetching feed for {username}: {url}")
-            feed = feedparser.parse(url)
+            # Download with a timeout so a hung host can't stall a worker
+            request = Request(url, headers=headers)
+            try:
+                with _FEED_OPENER.open(request, timeout=FEED_TIMEOUT) as response:
+                    body = response.read()
+                    response_headers = response.headers
+                if response_headers.get('Content-Encoding') == 'gzip':
+                    body = gzip.decompress(body)
+            except HTTPError as e:
+                if e.code == 304:
+                    return feedparser.FeedParserDict(status=304, entries=[])
+                raise
+            feed = feedparser.parse(body)
+            feed['status'] = 200
+            feed['etag'] = response_headers.get('ETag')
+            feed['modified'] = response_headers.get('Last-Modified')
             if feed.bozo:
                 logger.warning(f"Feed parsing error for {username}: {feed.bozo_exception}")
                 # Continue anyway as feedparser often returns usable data even with errors
@@ -59,16 +172,20 @@ class SubstackFetcher:
             logger.error(f"Error fetching feed for {username}: {e}")
             return None
 
-    def process_entry(self, entry: Dict[str, Any], profile: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def process_entry(self, entry: Dict[str, Any], profile: Dict[str, Any],
+                      now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
         """Convert RSS entry to Post dictionary.
 
         Args:
             entry: Single feed entry
             profile: Profile dictionary
+            now: Timestamp shared by the whole batch (default: current time)
 
         Returns:
             Dictionary ready for 'posts' table upsert, or None if invalid.
         """
+        if now is None:
+            now = datetime.now(timezone.utc)
         try:
             # Generate URN
             # entry.id is usually the URL, but let's use a safe fallback
@@ -86,14 +203,13 @@ class SubstackFetcher:
             urn = f"substack:{profile['username']}:{slug}"
 
             # Parse timestamp
-            published_struct = entry.get('published_parsed')
-            if published_struct:
-                posted_at_timestamp = int(mktime(published_struct))
+            posted_at_timestamp = entry_timestamp(entry)
+            if posted_at_timestamp is not None:
                 # Create timezone-aware datetime object
                 posted_at_dt = datetime.fromtimestamp(posted_at_timestamp, tz=timezone.utc)
             else:
-                posted_at_timestamp = int(datetime.now(timezone.utc).timestamp())
-                posted_at_dt = datetime.now(timezone.utc)
+                posted_at_timestamp = int(now.timestamp())
+                posted_at_dt = now
 
             # Prepare content
             text_content = entry.get('summary', '') or entry.get('description', '')
@@ -106,68 +222,190 @@ class SubstackFetcher:
                 'text_content': text_content,
                 'post_type': 'article',
                 'url': entry.get('link'),
-                'raw_json': json.dumps(entry),
+                'raw_json': entry_to_json(entry),
                 # Note: We don't set created_at here, let DB handle defaults for new rows
                 # For updates, we update updated_at
-                'updated_at': datetime.now(timezone.utc).isoformat()
+                'updated_at': now.isoformat()
             }
         except Exception as e:
             logger.error(f"Error processing entry {entry.get('title', 'Unknown')}: {e}")
             return None
 
-    def save_post(self, post_data: Dict[str, Any]) -> str:
-        """Upsert post to Supabase.
+    def _write_posts(self, rows: List[Dict[str, Any]], upsert: bool) -> List[Dict[str, Any]]:
+        """Insert (or upsert on urn) rows in one request.
+
+        If the batch is rejected, its rows are retried one at a time so that
+        a single bad row does not fail the rest of the profile's posts.
+
+        Returns:
+            The rows that could not be written
+        """
+        def write(payload):
+            table = self.client.table('posts')
+            if upsert:
+                table.upsert(payload, on_conflict='urn', returning='minimal').execute()
+            else:
+                table.insert(payload, returning='minimal').execute()
+
+        try:
+            write(rows)
+            return []
+        except Exception as e:
+            logger.warning(f"Batch write of {len(rows)} posts failed, retrying one by one: {e}")
+
+        failed = []
+        for row in rows:
+            try:
+                write(row)
+            except Exception as e:
+                logger.error(f"Error saving post {row['urn']}: {e}")
+                failed.append(row)
+        return failed
+
+    def save_posts_batch(
+        self, posts: List[Dict[str, Any]], now_iso: Optional[str] = None
+    ) -> Tuple[Dict[str, int], Set[str]]:
+        """Upsert many posts with one URN lookup and one write per kind.
 
         Args:
-            post_data: Dictionary of post fields
+            posts: List of post dictionaries from process_entry
+            now_iso: created_at for new rows (default: current time)
 
         Returns:
-            Status string: 'created', 'updated', or 'error'
+            Tuple of a dictionary with 'created', 'updated' and 'error'
+            counts, and the set of URNs that could not be stored
         """
+        stats = {'created': 0, 'updated': 0, 'error': 0}
+        if not posts:
+            return stats, set()
+
+        # A feed can repeat a URN; the last entry wins, as with one-by-one saves
+        by_urn = {post['urn']: post for post in posts}
+        duplicates = len(posts) - len(by_urn)
+
         try:
-            # Check if post exists by URN
-            existing = self.client.table('posts').select('post_id').eq('urn', post_data['urn']).execute()
-            
-            if existing.data:
-                # Update
-                post_id = existing.data[0]['post_id']
-                self.client.table('posts').update(post_data).eq('post_id', post_id).execute()
-                return 'updated'
-            else:
-                # Insert
-                post_data['post_id'] = generate_aws_id(PREFIX_POST)
-                post_data['created_at'] = datetime.now(timezone.utc).isoformat()
-                # Default fields
-                post_data['is_read'] = False
-                post_data['is_marked'] = False
-                
-                self.client.table('posts').insert(post_data).execute()
-                return 'created'
-                
+            # Look up existing posts by URN (IDs travel in the URL, so chunk them)
+            urns = list(by_urn)
+            existing_ids = {}
+            for i in range(0, len(urns), 100):
+                result = self.client.table('posts').select('post_id, urn').in_('urn', urns[i:i + 100]).execute()
+                existing_ids.update({row['urn']: row['post_id'] for row in result.data})
         except Exception as e:
-            logger.error(f"Error saving post {post_data.get('urn')}: {e}")
-            return 'error'
+            logger.error(f"Error looking up {len(posts)} posts: {e}")
+            stats['error'] = len(posts)
+            return stats, set(by_urn)
+
+        to_insert = []
+        to_update = []
+        if now_iso is None:
+            now_iso = datetime.now(timezone.utc).isoformat()
+        new_ids = iter(generate_aws_ids(PREFIX_POST, len(by_urn) - len(existing_ids)))
+        for urn, post in by_urn.items():
+            if urn in existing_ids:
+                to_update.append({**post, 'post_id': existing_ids[urn]})
+            else:
+                to_insert.append({
+                    **post,
+                    'post_id': next(new_ids),
+                    'created_at': now_iso,
+                    # Default fields
+                    'is_read': False,
+                    'is_marked': False
+                })
+
+        failed_urns = set()
+        if to_insert:
+            failed = self._write_posts(to_insert, upsert=False)
+            failed_urns.update(row['urn'] for row in failed)
+            stats['created'] = len(to_insert) - len(failed)
+        if to_update:
+            # Existing rows only get the fields process_entry produced
+            failed = self._write_posts(to_update, upsert=True)
+            failed_urns.update(row['urn'] for row in failed)
+            stats['updated'] = len(to_update) - len(failed)
+
+        # Repeated URNs count with their stored (or failed) row
+        stats['updated'] += duplicates
+        stats['error'] = len(failed_urns)
+        return stats, failed_urns
 
     def run(self):
         """Main execution method."""
         profiles = self.get_active_substack_profiles()
         logger.info(f"Found {len(profiles)} active Substack profiles.")
 
-        stats = {'created': 0, 'updated': 0, 'error': 0, 'total': 0}
+        stats = {'created': 0, 'updated': 0, 'error': 0, 'total': 0, 'unchanged': 0}
+        feed_cache = self.get_feed_cache()
+        cache_updates = []
 
-        for profile in profiles:
-            logger.info(f"Processing profile: {profile['username']}")
-            feed = self.fetch_feed(profile['username'])
-            
-            if not feed:
-                continue
-
-            for entry in feed.entries:
-                post_data = self.process_entry(entry, profile)
-                if post_data:
-                    status = self.save_post(post_data)
-                    stats[status] += 1
-                    stats['total'] += 1
+        # Fetch feeds in parallel; parse results and DB writes stay on this thread
+        with ThreadPoolExecutor(max_workers=FEED_WORKERS) as executor:
+            futures = {
+                executor.submit(self.fetch_feed, profile['username'], feed_cache.get(profile['username'])): profile
+                for profile in profiles
+            }
+
+            for future in as_completed(futures):
+                profile = futures[future]
+                logger.info(f"Processing profile: {profile['username']}")
+                feed = future.result()
+
+                if not feed:
+                    continue
+                if feed.get('status') == 304:
+                    logger.info(f"Feed unchanged for {profile['username']}")
+                    stats['unchanged'] += 1
+                    continue
+
+                # Entries published at or before the watermark were ingested
+                # by an earlier run; walking newest-first (undated entries
+                # first, as they can't be compared) lets us stop there
+                cached = feed_cache.get(profile['username']) or {}
+                last_seen = cached.get('last_posted_at_timestamp')
+                entries = sorted(
+                    feed.entries,
+                    key=lambda entry: (entry_timestamp(entry) is None, entry_timestamp(entry) or 0),
+                    reverse=True
+                )
+                # One timestamp for every row written for this profile
+                now = datetime.now(timezone.utc)
+                now_iso = now.isoformat()
+                posts = []
+                entry_timestamps = {}  # urn -> feed timestamp (None if undated)
+                for entry in entries:
+                    timestamp = entry_timestamp(entry)
+                    if last_seen is not None and timestamp is not None and timestamp <= last_seen:
+                        break
+                    post_data = self.process_entry(entry, profile, now)
+                    if post_data:
+                        posts.append(post_data)
+                        entry_timestamps[post_data['urn']] = timestamp
+
+                # One batched write per profile
+                batch_stats, failed_urns = self.save_posts_batch(posts, now_iso)
+                for status, count in batch_stats.items():
+                    stats[status] += count
+                stats['total'] += len(posts)
+
+                # Only remember what was actually stored, otherwise the next
+                # run would skip posts that never landed: the watermark stays
+                # below the oldest dated post that failed, and the validators
+                # are dropped so the feed is fetched in full again
+                failed_timestamps = [entry_timestamps[urn] for urn in failed_urns]
+                ceiling = min((t for t in failed_timestamps if t is not None), default=None)
+                timestamps = [entry_timestamp(entry) for entry in entries]
+                timestamps = [t for t in timestamps if t is not None and (ceiling is None or t < ceiling)]
+                if last_seen is not None:
+                    timestamps.append(last_seen)
+                cache_updates.append({
+                    'username': profile['username'],
+                    'etag': None if failed_urns else feed.get('etag'),
+                    'last_modified': None if failed_urns else feed.get('modified'),
+                    'last_posted_at_timestamp': max(timestamps, default=None),
+                    'fetched_at': now_iso
+                })
+
+        self.save_feed_cache(cache_updates)
         
         logger.info(f"Run complete. Stats: {stats}")
 
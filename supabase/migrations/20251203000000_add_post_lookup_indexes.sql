@@ -0,0 +1,11 @@
+-- ============================================ 
+-- Add Index: per-post download history
+-- ============================================ 
+-- Purpose: Serve per-post engagement history (post_id, newest first) from
+-- one index. The per-import "WHERE urn IN (...)" lookup in
+-- manage_data.import_directory needs no new index: posts.urn is UNIQUE NOT
+-- NULL, and the index behind that constraint already serves it.
+-- ============================================ 
+
+CREATE INDEX IF NOT EXISTS idx_downloads_post_downloaded_at
+    ON data_downloads (post_id, downloaded_at DESC);
@@ -0,0 +1,14 @@
+-- ============================================ 
+-- Add Indexes: profile/tag lookups
+-- ============================================ 
+-- Purpose: Serve "profiles with tag X" from a covering (tag_id, profile_id)
+-- index, which also makes the single-column tag_id index redundant, and let
+-- name-ordered profile listings read rows in index order.
+-- ============================================ 
+
+CREATE INDEX IF NOT EXISTS idx_profile_tags_tag_profile
+    ON profile_tags (tag_id, profile_id);
+
+DROP INDEX IF EXISTS idx_profile_tags_tag;
+
+CREATE INDEX IF NOT EXISTS idx_profiles_name ON profiles (name);
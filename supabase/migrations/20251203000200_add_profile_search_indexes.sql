@@ -0,0 +1,15 @@
+-- ============================================ 
+-- Add Indexes: profile search
+-- ============================================ 
+-- Purpose: ProfileManager.search_profiles matches ILIKE '%query%' on name
+-- and username. A leading wildcard can't use a B-tree index, so add
+-- trigram GIN indexes that Postgres uses for (I)LIKE substring matches.
+-- ============================================ 
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA extensions;
+
+CREATE INDEX IF NOT EXISTS idx_profiles_name_trgm
+    ON profiles USING gin (name extensions.gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_profiles_username_trgm
+    ON profiles USING gin (username extensions.gin_trgm_ops);
@@ -0,0 +1,13 @@
+-- ============================================ 
+-- Add Index: active profiles by name
+-- ============================================ 
+-- Purpose: Active-only profile listings (e.g. the CSV export) filter on
+-- is_active and order by name. A composite (is_active, name) index returns
+-- those rows already in name order, and also covers is_active-only filters,
+-- so the single-column index is dropped.
+-- ============================================ 
+
+CREATE INDEX IF NOT EXISTS idx_profiles_active_name
+    ON profiles (is_active, name);
+
+DROP INDEX IF EXISTS idx_profiles_active;
@@ -0,0 +1,19 @@
+-- ============================================ 
+-- Add Function: set_archive_urls
+-- ============================================ 
+-- Purpose: Let upload_to_s3.py store archive_url for a whole batch of
+-- uploaded media in one request instead of one PATCH per media_id.
+-- Input is a JSON array of {"media_id": ..., "archive_url": ...} objects;
+-- returns the media_ids that were updated.
+-- ============================================ 
+
+CREATE OR REPLACE FUNCTION set_archive_urls(updates jsonb)
+RETURNS SETOF text
+LANGUAGE sql
+AS $$
+    UPDATE post_media AS pm
+    SET archive_url = u.archive_url
+    FROM jsonb_to_recordset(updates) AS u(media_id text, archive_url text)
+    WHERE pm.media_id = u.media_id
+    RETURNING pm.media_id;
+$$;
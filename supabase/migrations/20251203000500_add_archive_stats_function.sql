@@ -0,0 +1,20 @@
+-- ============================================ 
+-- Add Function: archive_stats
+-- ============================================ 
+-- Purpose: Return archived/unarchived media counts for verify_s3_archive.py
+-- in one request instead of eight count queries. One row per media_type
+-- plus a rollup row (media_type NULL) with the overall totals.
+-- ============================================ 
+
+CREATE OR REPLACE FUNCTION archive_stats()
+RETURNS TABLE (media_type text, total bigint, archived bigint)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        pm.media_type,
+        count(*) AS total,
+        count(*) FILTER (WHERE pm.archive_url IS NOT NULL) AS archived
+    FROM post_media AS pm
+    GROUP BY ROLLUP (pm.media_type);
+$$;
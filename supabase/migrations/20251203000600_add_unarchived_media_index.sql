@@ -0,0 +1,12 @@
+-- ============================================ 
+-- Add Index: unarchived media backlog
+-- ============================================ 
+-- Purpose: upload_to_s3.py pages through post_media WHERE archive_url IS NULL
+-- ORDER BY created_at, media_id. A partial index over exactly those rows
+-- serves each page as an index range scan with no sort, and shrinks as
+-- media gets archived.
+-- ============================================ 
+
+CREATE INDEX IF NOT EXISTS idx_media_unarchived_created
+    ON post_media (created_at, media_id)
+    WHERE archive_url IS NULL;
@@ -0,0 +1,17 @@
+-- ============================================ 
+-- Add Column: post_media.file_extension
+-- ============================================ 
+-- Purpose: Record the cached file's extension at ingest, so the S3 upload
+-- and verification scripts can build {media_type}s/{md5_sum}.{ext} directly
+-- instead of guessing it from mime_type or searching the directory.
+-- Existing rows are backfilled from local_file_path.
+-- ============================================ 
+
+ALTER TABLE post_media ADD COLUMN IF NOT EXISTS file_extension TEXT;
+
+UPDATE post_media
+SET file_extension = substring(local_file_path FROM '\.([^./]+)$')
+WHERE file_extension IS NULL
+  AND local_file_path IS NOT NULL;
+
+COMMENT ON COLUMN post_media.file_extension IS 'Extension of the cached file (without the dot), set at ingest';
@@ -0,0 +1,16 @@
+-- ============================================ 
+-- Add Table: feed_cache
+-- ============================================ 
+-- Purpose: Remember each Substack feed's ETag / Last-Modified validators so
+-- substack_fetcher.py can send a conditional GET and skip feeds the server
+-- reports as unchanged (304 Not Modified) without downloading or parsing them.
+-- ============================================ 
+
+CREATE TABLE IF NOT EXISTS feed_cache (
+    username TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+COMMENT ON TABLE feed_cache IS 'HTTP cache validators from the last successful fetch of each Substack feed';
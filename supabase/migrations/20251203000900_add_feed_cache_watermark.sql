@@ -0,0 +1,11 @@
+-- ============================================ 
+-- Add Column: feed_cache.last_posted_at_timestamp
+-- ============================================ 
+-- Purpose: Record the newest publish time ingested from each Substack feed,
+-- so substack_fetcher.py can stop at the first entry it has already seen
+-- instead of re-processing and re-upserting the whole feed on every change.
+-- ============================================ 
+
+ALTER TABLE feed_cache ADD COLUMN IF NOT EXISTS last_posted_at_timestamp BIGINT;
+
+COMMENT ON COLUMN feed_cache.last_posted_at_timestamp IS 'Newest posted_at_timestamp ingested from the feed (Unix seconds)';
@@ -0,0 +1,43 @@
+-- ============================================ 
+-- Ensure Unique Indexes: profile_tags (profile_id, tag_id) and tags (name)
+-- ============================================ 
+-- Purpose: tag_profile / untag_profile look up one (profile_id, tag_id) pair,
+-- and TagManager._ensure_default_tags upserts with on_conflict='name', which
+-- PostgREST can only do against a unique index. Both are documented as
+-- UNIQUE in specs/database.md; create the index only where no unique index
+-- on those columns exists yet, so an existing constraint is not duplicated.
+-- (posts.urn is covered by its UNIQUE constraint, and profile_tags.tag_id
+-- by 20251203000100_add_profile_tag_indexes.sql.)
+-- ============================================ 
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1
+        FROM pg_index i
+        WHERE i.indrelid = 'profile_tags'::regclass
+          AND i.indisunique
+          AND (
+              SELECT array_agg(a.attname::text ORDER BY a.attname)
+              FROM pg_attribute a
+              WHERE a.attrelid = i.indrelid AND a.attnum = ANY (i.indkey)
+          ) = ARRAY['profile_id', 'tag_id']
+    ) THEN
+        CREATE UNIQUE INDEX idx_profile_tags_profile_tag
+            ON profile_tags (profile_id, tag_id);
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1
+        FROM pg_index i
+        WHERE i.indrelid = 'tags'::regclass
+          AND i.indisunique
+          AND (
+              SELECT array_agg(a.attname::text ORDER BY a.attname)
+              FROM pg_attribute a
+              WHERE a.attrelid = i.indrelid AND a.attnum = ANY (i.indkey)
+          ) = ARRAY['name']
+    ) THEN
+        CREATE UNIQUE INDEX idx_tags_name_unique ON tags (name);
+    END IF;
+END $$;
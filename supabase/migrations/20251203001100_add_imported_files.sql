@@ -0,0 +1,17 @@
+-- ============================================ 
+-- Add Table: imported_files
+-- ============================================ 
+-- Purpose: Record the SHA-256 of every JSON file manage_data.import_directory
+-- has imported, so re-importing a directory (e.g. update_data.py --retry)
+-- skips files whose exact contents are already in the database instead of
+-- probing every post again and recording duplicate data_downloads.
+-- ============================================ 
+
+CREATE TABLE IF NOT EXISTS imported_files (
+    file_sha256 TEXT PRIMARY KEY,
+    source_file_path TEXT,
+    run_id TEXT REFERENCES download_runs(run_id) ON DELETE SET NULL,
+    imported_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+COMMENT ON TABLE imported_files IS 'Content hashes of the scraped JSON files imported by manage_data.py';
@@ -0,0 +1,24 @@
+-- ============================================ 
+-- Add Function: database_stats
+-- ============================================ 
+-- Purpose: Return the overall row counts shown by update_data.py and
+-- manage_data.py stats in one request instead of four count queries.
+-- The partial index keeps the marked-post count to the (small) set of
+-- marked rows instead of a scan of every post.
+-- ============================================ 
+
+CREATE INDEX IF NOT EXISTS idx_posts_marked
+    ON posts (is_marked)
+    WHERE is_marked;
+
+CREATE OR REPLACE FUNCTION database_stats()
+RETURNS TABLE (total_posts bigint, marked_posts bigint, data_downloads bigint, download_runs bigint)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        (SELECT count(*) FROM posts) AS total_posts,
+        (SELECT count(*) FROM posts WHERE is_marked) AS marked_posts,
+        (SELECT count(*) FROM data_downloads) AS data_downloads,
+        (SELECT count(*) FROM download_runs) AS download_runs;
+$$;
@@ -0,0 +1,13 @@
+-- ============================================ 
+-- Add Index: download runs by start time
+-- ============================================ 
+-- Purpose: The recent-runs listings (update_data.py / update_youtube_stats.py
+-- statistics, the TUI run history) order download_runs by started_at DESC
+-- and take the first few rows. An index in that order lets Postgres read
+-- the newest runs directly instead of sorting the whole table. The SQLite
+-- schema (migrate_database.py) already had idx_runs_started_at; if the ported
+-- table kept it, this is a no-op, since a btree serves DESC via a backward scan.
+-- ============================================ 
+
+CREATE INDEX IF NOT EXISTS idx_runs_started_at
+    ON download_runs (started_at DESC);
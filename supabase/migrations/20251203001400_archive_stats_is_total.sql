@@ -0,0 +1,25 @@
+-- ============================================ 
+-- Update Function: archive_stats
+-- ============================================ 
+-- Purpose: Flag the ROLLUP grand-total row explicitly. It used to be
+-- identified by media_type IS NULL, but post_media rows whose media_type is
+-- NULL form their own group with the same NULL key, so the two rows were
+-- indistinguishable. GROUPING(media_type) = 1 marks only the rollup row.
+-- The return type changes, so the function is dropped and recreated.
+-- ============================================ 
+
+DROP FUNCTION IF EXISTS archive_stats();
+
+CREATE FUNCTION archive_stats()
+RETURNS TABLE (media_type text, total bigint, archived bigint, is_total boolean)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        pm.media_type,
+        count(*) AS total,
+        count(*) FILTER (WHERE pm.archive_url IS NOT NULL) AS archived,
+        GROUPING(pm.media_type) = 1 AS is_total
+    FROM post_media AS pm
+    GROUP BY ROLLUP (pm.media_type);
+$$;
@@ -1,10 +1,11 @@
 """Tag management for social-tui profiles with AWS-style identifiers."""
 
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 
 from supabase_client import get_supabase_client
-from db_utils import generate_aws_id, PREFIX_TAG, PREFIX_PROFILE_TAG
+from db_utils import generate_aws_id, generate_aws_ids, PREFIX_TAG, PREFIX_PROFILE_TAG
 
 
 class TagManager:
@@ -23,18 +24,55 @@ class TagManager:
     def __init__(self):
         """Initialize TagManager with Supabase connection."""
         self.client = get_supabase_client()
+        # tag_id -> tag row and name -> tag row, loaded on first use and
+        # dropped whenever this manager writes tags
+        self._tags_by_id: Optional[Dict[str, Dict[str, Any]]] = None
+        self._tags_by_name: Dict[str, Dict[str, Any]] = {}
         self._ensure_default_tags()
 
+    def _load_tags(self) -> Dict[str, Dict[str, Any]]:
+        """Return the tag cache, loading every tag in one query if needed."""
+        if self._tags_by_id is None:
+            result = self.client.table('tags').select('*').order('name').execute()
+            self._tags_by_id = {}
+            self._tags_by_name = {}
+            for tag in result.data:
+                self._cache_tag(tag)
+        return self._tags_by_id
+
+    def _cache_tag(self, tag: Dict[str, Any]):
+        """Add a tag row fetched from the database to the cache."""
+        self._tags_by_id[tag['tag_id']] = tag
+        self._tags_by_name[tag['name']] = tag
+
+    def _invalidate_tags(self):
+        """Drop cached tags after a write."""
+        self._tags_by_id = None
+        self._tags_by_name = {}
+
     def _ensure_default_tags(self):
         """Create default tags if they don't exist."""
         default_tags = ["aws", "ai", "startup"]
 
-        for tag_name in default_tags:
-            # Check if tag exists
-            existing = self.get_tag_by_name(tag_name)
-            if not existing:
-                color = self.DEFAULT_COLORS.get(tag_name, "white")
-                self.add_tag(tag_name, color)
+        self._load_tags()
+        missing = [name for name in default_tags if name not in self._tags_by_name]
+        if not missing:
+            return
+
+        # One batch insert; the UNIQUE(name) constraint skips any tag that
+        # another process created since the cache was loaded
+        now_iso = datetime.now(timezone.utc).isoformat()
+        self._invalidate_tags()
+        self.client.table('tags').upsert([
+            {
+                'tag_id': tag_id,
+                'name': name,
+                'description': None,
+                'color': self.DEFAULT_COLORS.get(name, "white"),
+                'created_at': now_iso
+            }
+            for tag_id, name in zip(generate_aws_ids(PREFIX_TAG, len(missing)), missing)
+        ], on_conflict='name', ignore_duplicates=True).execute()
 
     def add_tag(self, name: str, color: str = "cyan", description: str = None) -> str:
         """Add a new tag to the database.
@@ -54,6 +92,7 @@ class TagManager:
         name = name.lower().strip()
         tag_id = generate_aws_id(PREFIX_TAG)
 
+        self._invalidate_tags()
         self.client.table('tags').insert({
             'tag_id': tag_id,
             'name': name,
@@ -75,6 +114,7 @@ class TagManager:
         Returns:
             True if tag was deleted, False if not found
         """
+        self._invalidate_tags()
         result = self.client.table('tags').delete().eq('tag_id', tag_id).execute()
         return len(result.data) > 0
 
@@ -94,6 +134,7 @@ class TagManager:
         # Normalize tag name to lowercase
         new_name = new_name.lower().strip()
 
+        self._invalidate_tags()
         result = self.client.table('tags').update({
             'name': new_name
         }).eq('tag_id', tag_id).execute()
@@ -110,6 +151,7 @@ class TagManager:
         Returns:
             True if tag was updated, False if not found
         """
+        self._invalidate_tags()
         result = self.client.table('tags').update({
             'color': color
         }).eq('tag_id', tag_id).execute()
@@ -126,6 +168,7 @@ class TagManager:
         Returns:
             True if tag was updated, False if not found
         """
+        self._invalidate_tags()
         result = self.client.table('tags').update({
             'description': description
         }).eq('tag_id', tag_id).execute()
@@ -141,8 +184,15 @@ class TagManager:
         Returns:
             Tag dictionary or None if not found
         """
-        result = self.client.table('tags').select('*').eq('tag_id', tag_id).execute()
-        return result.data[0] if result.data else None
+        tag = self._load_tags().get(tag_id)
+        if tag is None:
+            # Not cached - it may have been created elsewhere since the load
+            result = self.client.table('tags').select('*').eq('tag_id', tag_id).execute()
+            if not result.data:
+                return None
+            tag = result.data[0]
+            self._cache_tag(tag)
+        return dict(tag)
 
     def get_tag_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Get a tag by name.
@@ -156,8 +206,16 @@ class TagManager:
         # Normalize tag name to lowercase
         name = name.lower().strip()
 
-        result = self.client.table('tags').select('*').eq('name', name).execute()
-        return result.data[0] if result.data else None
+        self._load_tags()
+        tag = self._tags_by_name.get(name)
+        if tag is None:
+            # Not cached - it may have been created elsewhere since the load
+            result = self.client.table('tags').select('*').eq('name', name).execute()
+            if not result.data:
+                return None
+            tag = result.data[0]
+            self._cache_tag(tag)
+        return dict(tag)
 
     def get_all_tags(self) -> List[Dict[str, Any]]:
         """Get all tags from the database.
@@ -165,8 +223,7 @@ class TagManager:
         Returns:
             List of tag dictionaries, sorted by name
         """
-        result = self.client.table('tags').select('*').order('name').execute()
-        return result.data
+        return [dict(tag) for tag in sorted(self._load_tags().values(), key=lambda t: t['name'])]
 
     def get_tags_with_counts(self) -> List[Dict[str, Any]]:
         """Get all tags with usage counts.
@@ -215,6 +272,37 @@ class TagManager:
                 return False
             raise
 
+    def tag_profiles_bulk(self, pairs: List[Tuple[str, str]]) -> int:
+        """Add many profile-tag associations in one request.
+
+        Pairs that are already tagged are skipped, like tag_profile's
+        duplicate handling, via the UNIQUE (profile_id, tag_id) constraint.
+
+        Args:
+            pairs: (profile_id, tag_id) tuples to add
+
+        Returns:
+            Number of associations actually added
+        """
+        unique_pairs = list(dict.fromkeys(pairs))
+        if not unique_pairs:
+            return 0
+
+        now_iso = datetime.now(timezone.utc).isoformat()
+        rows = [{
+            'profile_tag_id': profile_tag_id,
+            'profile_id': profile_id,
+            'tag_id': tag_id,
+            'created_at': now_iso
+        } for profile_tag_id, (profile_id, tag_id) in zip(
+            generate_aws_ids(PREFIX_PROFILE_TAG, len(unique_pairs)), unique_pairs
+        )]
+
+        result = self.client.table('profile_tags').upsert(
+            rows, on_conflict='profile_id,tag_id', ignore_duplicates=True
+        ).execute()
+        return len(result.data)
+
     def untag_profile(self, profile_id: str, tag_id: str) -> bool:
         """Remove a tag from a profile.
 
@@ -259,8 +347,33 @@ class TagManager:
         Returns:
             List of tag names
         """
-        tags = self.get_profile_tags(profile_id)
-        return [tag['name'] for tag in tags]
+        # Pull just the names through the tags relationship in one query
+        result = self.client.table('profile_tags').select('tags(name)').eq('profile_id', profile_id).execute()
+        return sorted(row['tags']['name'] for row in result.data if row.get('tags'))
+
+    def get_profile_tag_names_bulk(self, profile_ids: List[str]) -> Dict[str, List[str]]:
+        """Get tag names for many profiles at once.
+
+        Use this instead of calling get_profile_tag_names per row when
+        rendering a list of profiles.
+
+        Args:
+            profile_ids: IDs of the profiles
+
+        Returns:
+            Dictionary mapping each profile ID to its sorted tag names
+            (profiles without tags map to an empty list)
+        """
+        names = defaultdict(list)
+        # IDs are sent in the request URL, so fetch them in chunks
+        for i in range(0, len(profile_ids), 100):
+            result = self.client.table('profile_tags').select('profile_id, tags(name)').in_(
+                'profile_id', profile_ids[i:i + 100]
+            ).execute()
+            for row in result.data:
+                if row.get('tags'):
+                    names[row['profile_id']].append(row['tags']['name'])
+        return {profile_id: sorted(names.get(profile_id, [])) for profile_id in profile_ids}
 
     def set_profile_tags(self, profile_id: str, tag_ids: List[str]):
         """Set tags for a profile (replaces existing tags).
@@ -272,17 +385,18 @@ class TagManager:
         # Remove all existing tags
         self.client.table('profile_tags').delete().eq('profile_id', profile_id).execute()
 
-        # Add new tags
+        # Add new tags in a single insert
         if tag_ids:
-            new_tags = []
-            for tag_id in tag_ids:
-                profile_tag_id = generate_aws_id(PREFIX_PROFILE_TAG)
-                new_tags.append({
-                    'profile_tag_id': profile_tag_id,
-                    'profile_id': profile_id,
-                    'tag_id': tag_id,
-                    'created_at': datetime.now(timezone.utc).isoformat()
-                })
+            now_iso = datetime.now(timezone.utc).isoformat()
+            unique_tag_ids = list(dict.fromkeys(tag_ids))
+            new_tags = [{
+                'profile_tag_id': profile_tag_id,
+                'profile_id': profile_id,
+                'tag_id': tag_id,
+                'created_at': now_iso
+            } for profile_tag_id, tag_id in zip(
+                generate_aws_ids(PREFIX_PROFILE_TAG, len(unique_tag_ids)), unique_tag_ids
+            )]
 
             self.client.table('profile_tags').insert(new_tags).execute()
 
@@ -47,22 +47,22 @@ def main():
         aws_tag = tm.get_tag_by_name("aws")
         ai_tag = tm.get_tag_by_name("ai")
 
-        # Tag first 3 profiles with AWS
-        for i in range(min(3, len(profiles))):
-            tm.tag_profile(profiles[i]['id'], aws_tag['id'])
-            print(f"   ✓ Tagged {profiles[i]['name']} with 'aws'")
-
-        # Tag first 2 profiles with AI
-        for i in range(min(2, len(profiles))):
-            tm.tag_profile(profiles[i]['id'], ai_tag['id'])
-            print(f"   ✓ Tagged {profiles[i]['name']} with 'ai'")
+        # Tag first 3 profiles with AWS and first 2 with AI in one request
+        pairs = [(profile['id'], aws_tag['id']) for profile in profiles[:3]]
+        pairs += [(profile['id'], ai_tag['id']) for profile in profiles[:2]]
+        tm.tag_profiles_bulk(pairs)
+        for profile in profiles[:3]:
+            print(f"   ✓ Tagged {profile['name']} with 'aws'")
+        for profile in profiles[:2]:
+            print(f"   ✓ Tagged {profile['name']} with 'ai'")
 
     # Test filtering by tags
     print("\n7. Testing tag filtering...")
     aws_profiles = pm.get_profiles_by_tag("aws")
     print(f"   Profiles with 'aws' tag: {len(aws_profiles)}")
+    tag_names = tm.get_profile_tag_names_bulk([profile['id'] for profile in aws_profiles])
     for profile in aws_profiles:
-        tags = tm.get_profile_tag_names(profile['id'])
+        tags = tag_names[profile['id']]
         print(f"   - {profile['name']} (tags: {', '.join(tags)})")
 
     print("\n8. Testing multi-tag filtering (OR)...")
@@ -72,8 +72,9 @@ def main():
     print("\n9. Testing multi-tag filtering (AND)...")
     both_profiles_and = pm.get_profiles_by_tags(["aws", "ai"], match_all=True)
     print(f"   Profiles with 'aws' AND 'ai': {len(both_profiles_and)}")
+    tag_names = tm.get_profile_tag_names_bulk([profile['id'] for profile in both_profiles_and])
     for profile in both_profiles_and:
-        tags = tm.get_profile_tag_names(profile['id'])
+        tags = tag_names[profile['id']]
         print(f"   - {profile['name']} (tags: {', '.join(tags)})")
 
     # Export to CSV
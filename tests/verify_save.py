@@ -1,14 +1,32 @@
 
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, mock_open, patch
 import json
-import os
-import glob
-from datetime import datetime
+from datetime import datetime, timezone
+from pathlib import Path
 from interactive_posts import MainScreen
 
+FIXED_DT = datetime(2025, 11, 25, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class FixedDatetime(datetime):
+    """datetime whose now() is frozen at FIXED_DT.
+
+    A subclass rather than a MagicMock, so datetime(...), strptime and other
+    classmethods used by the code under test keep working.
+    """
+
+    @classmethod
+    def now(cls, tz=None):
+        # Naive when called without tz, like the real datetime.now()
+        return FIXED_DT.replace(tzinfo=None) if tz is None else FIXED_DT.astimezone(tz)
+
+
 class TestSaveFunctionality(unittest.TestCase):
     def setUp(self):
+        # Freeze the clock for the load path (its date cutoffs) as well as the tests
+        self.enterContext(patch("interactive_posts.datetime", FixedDatetime))
+
         self.data_dir = "data/20251125/linkedin"
         self.screen = MainScreen(self.data_dir)
         # Mock the app and notify method
@@ -16,48 +34,44 @@ class TestSaveFunctionality(unittest.TestCase):
         self.screen.notify = MagicMock()
         
         # Load posts manually since on_mount is not called in this test setup
-        self.screen.posts = self.screen.load_posts()
-        # Filter posts logic from load_and_display_posts to ensure we have valid posts
-        thirty_days_ago = datetime.now()
         # Just use all posts for testing purposes
-        for post in self.screen.posts:
-             post["datetime_obj"] = datetime.now() # Mock datetime
+        self.screen.posts = self.screen.load_posts()
         
     def test_save_marked_posts(self):
         # Mark some posts
         if not self.screen.posts:
             self.skipTest("No posts found to test with")
             
-        self.screen.marked_posts.add(0)
+        mark = {"actions": {"s"}, "timestamp": FIXED_DT}
+        self.screen.marked_posts[0] = mark
         if len(self.screen.posts) > 1:
-            self.screen.marked_posts.add(1)
+            self.screen.marked_posts[1] = mark
             
         # Mock filter text
         self.screen.filter_active = True
         self.screen.filter_text = "test query"
         
-        # Call save action
-        self.screen.action_save_marked()
-        
-        # Check if file was created
-        files = glob.glob("marked_posts_*.json")
-        self.assertTrue(len(files) > 0, "No saved file found")
+        # Call save action, capturing the write instead of touching the disk
+        with patch("interactive_posts.open", mock_open()) as mocked_open, \
+                patch.object(Path, "mkdir"):
+            self.screen.action_save_marked()
         
-        # Get the latest file
-        latest_file = max(files, key=os.path.getctime)
+        # Check the file that would have been created
+        mocked_open.assert_called_once()
+        filename = mocked_open.call_args.args[0]
+        self.assertEqual(filename, Path("output") / "marked_posts_20251125_120000.json")
         
-        with open(latest_file, 'r') as f:
-            data = json.load(f)
+        written = "".join(c.args[0] for c in mocked_open().write.call_args_list)
+        data = json.loads(written)
             
         # Verify structure
         self.assertIn("search", data)
         self.assertIn("matching_elements", data)
         self.assertEqual(data["search"]["query_string"], "test query")
+        self.assertEqual(data["search"]["date"], FIXED_DT.isoformat())
         self.assertEqual(len(data["matching_elements"]), len(self.screen.marked_posts))
         
-        # Clean up
-        os.remove(latest_file)
-        print(f"Verified save functionality with file: {latest_file}")
+        print(f"Verified save functionality with file: {filename}")
 
 if __name__ == '__main__':
     unittest.main()
@@ -14,19 +14,26 @@ Usage:
     uv run python update_data.py --skip-scrape      # Only import existing data
     uv run python update_data.py --skip-s3-upload   # Skip S3 upload
     uv run python update_data.py --date 20251129    # Import specific date
+    uv run python update_data.py --stats-json stats.json  # Also save import counters as JSON
 """
 
 import argparse
+import json
 import subprocess
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
 from supabase_client import get_supabase_client
-from manage_data import create_download_run, import_directory, complete_download_run
+from manage_data import (
+    create_download_run, import_directory, complete_download_run, get_database_stats, list_json_files
+)
 from scripts.s3_upload.upload_to_s3 import upload_media_to_s3
 from profile_manager import ProfileManager
 
+# Lines run_apify.sh prints to announce the directory it writes into
+SCRAPE_DIR_PREFIXES = ("Creating new directory: ", "Using existing directory: ")
+
 
 def export_linkedin_profiles():
     """Export LinkedIn profiles to CSV for Apify scraping.
@@ -77,11 +84,15 @@ def export_linkedin_profiles():
 def run_apify_scrape(data_dir=None):
     """Run the apify scraping script.
 
+    The script's output is streamed line by line so progress stays visible,
+    and the directory it announces is captured so the import step reads
+    exactly what was scraped.
+
     Args:
         data_dir: Optional directory path to use (for retry). If None, creates new timestamped directory.
 
     Returns:
-        True if successful, False otherwise
+        Path to the scraped directory if successful, None otherwise
     """
     print("\n" + "=" * 70)
     print("Step 1: Scraping LinkedIn Data")
@@ -90,32 +101,41 @@ def run_apify_scrape(data_dir=None):
     script_path = Path("run_apify.sh")
     if not script_path.exists():
         print(f"Error: {script_path} not found")
-        return False
+        return None
+
+    command = ["bash", str(script_path)]
+    if data_dir:
+        print(f"Retrying with directory: {data_dir}")
+        command.append(str(data_dir))
+
+    scraped_dir = Path(data_dir) if data_dir else None
 
     try:
         # Run the script and stream output
-        if data_dir:
-            print(f"Retrying with directory: {data_dir}")
-            result = subprocess.run(
-                ["bash", str(script_path), str(data_dir)],
-                check=True,
-                text=True
-            )
-        else:
-            result = subprocess.run(
-                ["bash", str(script_path)],
-                check=True,
-                text=True
-            )
+        with subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        ) as proc:
+            for line in proc.stdout:
+                print(line, end="", flush=True)
+                for prefix in SCRAPE_DIR_PREFIXES:
+                    if line.startswith(prefix):
+                        scraped_dir = Path(line[len(prefix):].strip())
+                        break
+
+        if proc.returncode != 0:
+            print(f"\n✗ Scraping failed with exit code {proc.returncode}")
+            return None
+
         print("\n✓ Scraping completed successfully")
-        return True
+        return scraped_dir
 
-    except subprocess.CalledProcessError as e:
-        print(f"\n✗ Scraping failed with exit code {e.returncode}")
-        return False
     except Exception as e:
         print(f"\n✗ Scraping failed: {e}")
-        return False
+        return None
 
 
 def get_most_recent_directory(date_filter=None):
@@ -154,16 +174,50 @@ def get_most_recent_directory(date_filter=None):
     return matching_dirs[0]
 
 
-def get_todays_directory():
+def get_todays_directory(today=None):
     """Get today's most recent data directory path.
 
+    Args:
+        today: Optional date string (YYYYMMDD). If None, uses the current UTC date.
+
     Returns:
         Path object or None if directory doesn't exist
     """
-    today = datetime.now(timezone.utc).strftime("%Y%m%d")
+    if today is None:
+        today = datetime.now(timezone.utc).strftime("%Y%m%d")
     return get_most_recent_directory(date_filter=today)
 
 
+def resolve_import_dir(date=None):
+    """Resolve the directory to import, exiting if it doesn't exist.
+
+    Args:
+        date: Optional date string (YYYYMMDD). If None, uses today's most recent run.
+
+    Returns:
+        Path object for the most recent run directory of that date
+    """
+    if date:
+        # Import specific date (most recent run for that date)
+        directory_path = get_most_recent_directory(date_filter=date)
+        if not directory_path:
+            print(f"\nError: No data directory found for date: {date}")
+            print(f"Looked for directories matching: data/{date}*/linkedin")
+            sys.exit(1)
+        print(f"\nUsing directory: {directory_path}")
+        return directory_path
+
+    # Import today's data (most recent run for today)
+    today = datetime.now(timezone.utc).strftime("%Y%m%d")
+    directory_path = get_todays_directory(today)
+    if not directory_path:
+        print(f"\nError: Today's data directory not found")
+        print(f"Looked for directories matching: data/{today}*/linkedin")
+        print("Run with --date YYYYMMDD to import a specific date")
+        sys.exit(1)
+    return directory_path
+
+
 def get_last_run_time():
     """Get the timestamp of the most recent run.
 
@@ -248,13 +302,14 @@ def import_data(directory_path):
         return None
 
     # Count files
-    json_files = list(directory_path.glob("*.json"))
+    json_files = list_json_files(directory_path)
     if not json_files:
         print(f"Warning: No JSON files found in {directory_path}")
         return {"processed": 0, "new": 0, "duplicates": 0, "errors": 0}
 
     print(f"Found {len(json_files)} JSON files")
 
+    run_id = None
     try:
         client = get_supabase_client()
 
@@ -263,7 +318,7 @@ def import_data(directory_path):
         print(f"Created download run: {run_id}")
 
         # Import directory
-        stats, _ = import_directory(client, str(directory_path), run_id=run_id)
+        stats, _ = import_directory(client, str(directory_path), run_id=run_id, files=json_files)
 
         # Complete download run
         complete_download_run(client, run_id, stats)
@@ -274,6 +329,13 @@ def import_data(directory_path):
         print(f"  New:        {stats['new']}")
         print(f"  Duplicates: {stats['duplicates']}")
         print(f"  Errors:     {stats['errors']}")
+        print(f"  Skipped:    {stats.get('files_skipped', 0)} file(s) already imported")
+        print(f"\n  Counters:")
+        print(f"    Files:       {stats.get('files_found', 0)}")
+        print(f"    URNs probed: {stats.get('urns_probed', 0)}")
+        print(f"    Downloads:   {stats.get('downloads_new', 0)} new")
+        print(f"    Parse time:  {stats.get('parse_seconds', 0.0):.2f}s")
+        print(f"    Import time: {stats.get('import_seconds', 0.0):.2f}s")
         print(f"\n  Media:")
         print(f"    Found:    {stats.get('media_total', 0)}")
         print(f"    Cached:   {stats.get('media_cached', 0)}")
@@ -286,6 +348,13 @@ def import_data(directory_path):
         print(f"\n✗ Import failed: {e}")
         import traceback
         traceback.print_exc()
+
+        # Don't leave the run marked as running
+        if run_id is not None:
+            try:
+                complete_download_run(client, run_id, {"errors": 1}, error_message=str(e))
+            except Exception as close_error:
+                print(f"Could not mark download run {run_id} as failed: {close_error}")
         return None
 
 
@@ -329,19 +398,8 @@ def show_statistics():
     try:
         client = get_supabase_client()
 
-        # Post stats
-        total_posts_result = client.table('posts').select('post_id', count='exact').execute()
-        total_posts = total_posts_result.count if total_posts_result.count is not None else 0
-
-        marked_result = client.table('posts').select('post_id', count='exact').eq('is_marked', True).execute()
-        marked = marked_result.count if marked_result.count is not None else 0
-
-        # Download stats
-        total_downloads_result = client.table('data_downloads').select('download_id', count='exact').execute()
-        total_downloads = total_downloads_result.count if total_downloads_result.count is not None else 0
-
-        total_runs_result = client.table('download_runs').select('run_id', count='exact').execute()
-        total_runs = total_runs_result.count if total_runs_result.count is not None else 0
+        # Post, download and run counts
+        db_stats = get_database_stats(client)
 
         # Recent runs
         recent_runs_result = client.table('download_runs').select(
@@ -350,10 +408,10 @@ def show_statistics():
         recent_runs = recent_runs_result.data
 
         print(f"\nOverall Statistics:")
-        print(f"  Total Posts:     {total_posts:,}")
-        print(f"  Marked Posts:    {marked:,}")
-        print(f"  Data Downloads:  {total_downloads:,}")
-        print(f"  Download Runs:   {total_runs:,}")
+        print(f"  Total Posts:     {db_stats['total_posts']:,}")
+        print(f"  Marked Posts:    {db_stats['marked_posts']:,}")
+        print(f"  Data Downloads:  {db_stats['data_downloads']:,}")
+        print(f"  Download Runs:   {db_stats['download_runs']:,}")
 
         if recent_runs:
             print(f"\nRecent Download Runs:")
@@ -414,6 +472,11 @@ Note: The script automatically exports active LinkedIn profiles to CSV before sc
         action="store_true",
         help="Skip S3 upload of newly cached media"
     )
+    parser.add_argument(
+        "--stats-json",
+        metavar="PATH",
+        help="Write the import statistics to PATH as JSON"
+    )
     parser.add_argument(
         "--force",
         action="store_true",
@@ -441,6 +504,7 @@ Note: The script automatically exports active LinkedIn profiles to CSV before sc
 
     # Determine directory to use
     retry_directory = None
+    directory_path = None
     if args.retry:
         # Find most recent directory for retry
         retry_directory = get_most_recent_directory()
@@ -448,6 +512,10 @@ Note: The script automatically exports active LinkedIn profiles to CSV before sc
             print("\nError: No existing data directories found to retry")
             sys.exit(1)
         print(f"\nRetrying most recent run: {retry_directory.parent}")
+        directory_path = retry_directory
+    elif args.skip_scrape:
+        # Nothing will be scraped, so fail fast if there is nothing to import
+        directory_path = resolve_import_dir(args.date)
 
     # Step 0: Export LinkedIn profiles to CSV (before scraping)
     if not args.skip_scrape:
@@ -458,46 +526,38 @@ Note: The script automatically exports active LinkedIn profiles to CSV before sc
             # Continue anyway in case user wants to import existing data
 
     # Step 1: Scrape (unless skipped)
+    scraped_directory = None
     if not args.skip_scrape:
         if args.retry:
             # Retry: use existing directory
-            success = run_apify_scrape(data_dir=retry_directory)
+            scraped_directory = run_apify_scrape(data_dir=retry_directory)
         else:
             # Normal run: create new directory
-            success = run_apify_scrape()
+            scraped_directory = run_apify_scrape()
 
-        if not success:
+        if not scraped_directory:
             print("\nWarning: Scraping failed, but will attempt to import existing data")
     else:
         print("\nSkipping scrape step (--skip-scrape)")
 
     # Step 2: Import
-    if args.retry:
-        # Use the retry directory
-        directory_path = retry_directory
-    elif args.date:
-        # Import specific date (most recent run for that date)
-        directory_path = get_most_recent_directory(date_filter=args.date)
-        if not directory_path:
-            print(f"\nError: No data directory found for date: {args.date}")
-            print(f"Looked for directories matching: data/{args.date}*/linkedin")
-            sys.exit(1)
-        print(f"\nUsing directory: {directory_path}")
-    else:
-        # Import today's data (most recent run for today)
-        directory_path = get_todays_directory()
-        if not directory_path:
-            today = datetime.now(timezone.utc).strftime("%Y%m%d")
-            print(f"\nError: Today's data directory not found")
-            print(f"Looked for directories matching: data/{today}*/linkedin")
-            print("Run with --date YYYYMMDD to import a specific date")
-            sys.exit(1)
+    if directory_path is None:
+        if scraped_directory and not args.date:
+            # Import the directory the scrape just wrote
+            directory_path = scraped_directory
+        else:
+            directory_path = resolve_import_dir(args.date)
 
     stats = import_data(directory_path)
     if stats is None:
         print("\n✗ Update failed")
         sys.exit(1)
 
+    if args.stats_json:
+        with open(args.stats_json, 'w') as f:
+            json.dump(stats, f, indent=2)
+        print(f"\nWrote import statistics to {args.stats_json}")
+
     # Step 3: Upload to S3 (unless skipped)
     if not args.skip_s3_upload:
         s3_stats = upload_to_s3()